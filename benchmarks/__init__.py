@@ -0,0 +1 @@
+"""Benchmarks for the Audi Connect integration."""
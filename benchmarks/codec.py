@@ -0,0 +1,93 @@
+"""JSON codec and compression benchmark for the Audi Connect payloads.
+
+Run from the repository root::
+
+    python -m benchmarks.codec --vehicles 1 10 100
+
+The status, position and trip payloads served by the fake server for one
+refresh are decoded and the diagnostics-sized snapshot is encoded with the
+standard library ``json`` module and with ``orjson`` (the codec Home
+Assistant uses for its client sessions and diagnostics). The bytes per
+refresh are reported raw and gzip compressed.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import time
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+from .fake_server import fake_state, fake_states, fake_vin
+
+
+def refresh_payloads(vehicles: int, trips: int = 10) -> list[bytes]:
+    """Return the response bodies of one refresh of the fleet."""
+    payloads = []
+    for index in range(vehicles):
+        state = fake_state(index, 0)
+        payloads.append(
+            json.dumps({"states": fake_states(index, 0), "state": state}).encode()
+        )
+        payloads.append(json.dumps(state["position"]).encode())
+        payloads.append(
+            json.dumps(
+                {
+                    "trips": [
+                        {"id": trip, "vin": fake_vin(index), "mileage": trip * 12}
+                        for trip in range(trips)
+                    ]
+                }
+            ).encode()
+        )
+    return payloads
+
+
+def _best(func: Any, rounds: int) -> float:
+    """Return the best duration of ``rounds`` runs in milliseconds."""
+    durations = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return min(durations) * 1000
+
+
+def measure(vehicles: int, rounds: int) -> dict[str, Any]:
+    """Measure one fleet size."""
+    payloads = refresh_payloads(vehicles)
+    snapshot = [json.loads(payload) for payload in payloads]
+    result: dict[str, Any] = {
+        "vehicles": vehicles,
+        "raw_bytes": sum(len(payload) for payload in payloads),
+        "gzip_bytes": sum(len(gzip.compress(payload)) for payload in payloads),
+        "json_decode_ms": _best(lambda: [json.loads(p) for p in payloads], rounds),
+        "json_encode_ms": _best(lambda: json.dumps(snapshot), rounds),
+    }
+    if orjson is not None:
+        result["orjson_decode_ms"] = _best(
+            lambda: [orjson.loads(p) for p in payloads], rounds
+        )
+        result["orjson_encode_ms"] = _best(lambda: orjson.dumps(snapshot), rounds)
+    return {
+        key: round(value, 3) if isinstance(value, float) else value
+        for key, value in result.items()
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vehicles", type=int, nargs="+", default=(1, 10, 100))
+    parser.add_argument("--rounds", type=int, default=50)
+    arguments = parser.parse_args()
+    print(
+        json.dumps(
+            [measure(vehicles, arguments.rounds) for vehicles in arguments.vehicles],
+            indent=2,
+        )
+    )
@@ -0,0 +1,417 @@
+"""Local stand-in for the Audi Connect cloud.
+
+The server exposes a small subset of the Audi/VW endpoints used by the
+integration (login, vehicle list, status, position, trips and the
+slow-changing detail endpoints read by diagnostics). It can simulate any
+number of vehicles, a fixed latency with jitter and injected errors, and
+compresses its responses when the client accepts it.
+
+``FakeAudiConnect`` mirrors the parts of ``audiconnectpy.AudiConnect`` the
+integration relies on and talks to the server over real HTTP, so the
+coordinator, the platforms and diagnostics run unmodified on top of it.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+import random
+from typing import Any
+
+from aiohttp import ClientSession, web
+from audiconnectpy import AudiException, AuthorizationError
+
+DETAIL_ENDPOINTS = (
+    "vehicle_details",
+    "vehicle",
+    "stored_position",
+    "destinations",
+    "history",
+    "vehicule_users",
+    "charger",
+    "tripdata",
+    "operations_list",
+    "climater",
+    "preheater",
+    "climater_timer",
+    "capabilities",
+    "honkflash",
+    "real_car_data",
+    "mbb_status",
+    "identity_data",
+    "users",
+    "fences",
+    "fences_config",
+    "speed_alert",
+    "speed_config",
+)
+
+
+@dataclass
+class FakeServerConfig:
+    """Behaviour of the fake server."""
+
+    vehicles: int = 1
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    trips: int = 10
+    seed: int = 0
+    compress: bool = True
+
+
+def fake_vin(index: int) -> str:
+    """Return a stable 17 characters VIN for a vehicle index."""
+    return f"WAUZZZ{index:011d}"
+
+
+def fake_states(index: int, tick: int) -> dict[str, Any]:
+    """Return the states of a vehicle for a refresh tick."""
+    charging = (index + tick) % 4 == 0
+    return {
+        "last_access": "2024-01-01T12:00:00+00:00",
+        "last_update_time": f"2024-01-01T12:{tick % 60:02d}:00+00:00",
+        "climatisation_state": "off",
+        "charging_state": "charging" if charging else "notReadyForCharging",
+        "utc_time_and_kilometer_status": 10000 + index * 100 + tick,
+        "maintenance_interval_distance_to_oil_change": -12000,
+        "maintenance_interval_time_to_oil_change": -200,
+        "maintenance_interval_distance_to_inspection": -20000,
+        "maintenance_interval_time_to_inspection": -300,
+        "oil_level_dipsticks_percentage": 80,
+        "temperature_outside": 12,
+        "total_range": 400 - tick % 100,
+        "tank_level_in_percentage": 70,
+        "climatisation_target_temp": 2950,
+        "climatisation_heater_src": "electric",
+        "max_charge_current": 16,
+        "actual_charge_rate": 110 if charging else 0,
+        "actual_charge_rate_unit": "km_per_hour",
+        "charging_power": 11000 if charging else 0,
+        "state_of_charge": 40 + tick % 60,
+        "remaining_charging_time": 95,
+        "outdoor_temperature": 2850,
+        "doors_trunk_status": "Closed",
+        "trip_short_current": {"timestamp": "2024-01-01T11:00:00+00:00"},
+        "trip_long_current": {"timestamp": "2024-01-01T10:00:00+00:00"},
+    }
+
+
+def fake_state(index: int, tick: int) -> dict[str, Any]:
+    """Return the raw (camelCase) vehicle state for a refresh tick."""
+    return {
+        "overallLockStatus": "locked" if tick % 2 == 0 else "unlocked",
+        "anyWindowOpen": False,
+        "anyDoorUnlocked": tick % 2 == 1,
+        "trunkUnlocked": False,
+        "trunkLocked": True,
+        "hoodOpen": False,
+        "isMoving": False,
+        "leftFrontDoorLocked": True,
+        "rightFrontDoorLocked": True,
+        "leftRearDoorLocked": True,
+        "rightRearDoorLocked": True,
+        "climatisationState": "off",
+        "chargingState": "charging" if (index + tick) % 4 == 0 else "off",
+        "windowHeatingState": "off",
+        "targetTemperature": 21,
+        "position": {"lat": 48.76 + index / 1000, "lng": 11.42 + tick / 10000},
+        "parkingPosition": {"parkingTime": "2024-01-01T11:30:00+00:00"},
+    }
+
+
+class FakeAudiServer:
+    """aiohttp application simulating the Audi Connect cloud."""
+
+    def __init__(self, config: FakeServerConfig | None = None) -> None:
+        """Initialize the server."""
+        self.config = config or FakeServerConfig()
+        self.tick = 0
+        self.requests: dict[str, int] = {}
+        self._random = random.Random(self.config.seed)
+        self._runner: web.AppRunner | None = None
+        self._sockets: set[web.WebSocketResponse] = set()
+        self.url = ""
+        self.app = web.Application(middlewares=[self._middleware])
+        self.app.add_routes(
+            [
+                web.post("/login", self._login),
+                web.get("/vehicles", self._vehicles),
+                web.get("/vehicles/{vin}/status", self._status),
+                web.get("/vehicles/{vin}/position", self._position),
+                web.get("/vehicles/{vin}/trips/{kind}", self._trips),
+                web.get("/vehicles/{vin}/details/{name}", self._details),
+                web.get("/push", self._push),
+            ]
+        )
+
+    async def async_start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start the server and return its base url."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        sockets = site._server.sockets  # pylint: disable=protected-access
+        self.url = f"http://{host}:{sockets[0].getsockname()[1]}"
+        return self.url
+
+    async def async_stop(self) -> None:
+        """Stop the server."""
+        for socket in list(self._sockets):
+            await socket.close()
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Count requests, add latency and inject errors."""
+        route = request.match_info.route.resource.canonical
+        self.requests[route] = self.requests.get(route, 0) + 1
+        if delay := self.config.latency + self._random.uniform(0, self.config.jitter):
+            await asyncio.sleep(delay)
+        if self.config.error_rate and self._random.random() < self.config.error_rate:
+            return web.json_response(
+                {"error": "injected"}, status=self.config.error_status
+            )
+        response = await handler(request)
+        if self.config.compress and isinstance(response, web.Response):
+            response.enable_compression()
+        return response
+
+    async def async_push(self, vin: str, states: dict[str, Any]) -> None:
+        """Send a partial state to the connected push clients."""
+        for socket in list(self._sockets):
+            await socket.send_json({"vin": vin, "states": states})
+
+    async def _push(self, request: web.Request) -> web.WebSocketResponse:
+        """Keep a push client connected."""
+        socket = web.WebSocketResponse()
+        await socket.prepare(request)
+        self._sockets.add(socket)
+        try:
+            async for _ in socket:
+                pass
+        finally:
+            self._sockets.discard(socket)
+        return socket
+
+    def _index(self, request: web.Request) -> int:
+        """Return the vehicle index of a request."""
+        vin = request.match_info["vin"]
+        if not vin.startswith("WAUZZZ") or int(vin[6:]) >= self.config.vehicles:
+            raise web.HTTPNotFound()
+        return int(vin[6:])
+
+    async def _login(self, request: web.Request) -> web.Response:
+        """Return an access token."""
+        body = await request.json()
+        if not body.get("username") or not body.get("password"):
+            return web.json_response({"error": "invalid_grant"}, status=401)
+        return web.json_response({"access_token": "fake", "expires_in": 3600})
+
+    async def _vehicles(self, request: web.Request) -> web.Response:
+        """Return the vehicle list."""
+        self.tick += 1
+        return web.json_response(
+            {
+                "vehicles": [
+                    {
+                        "vin": fake_vin(i),
+                        "csid": f"CSID{i:06d}",
+                        "title": f"Audi {i}",
+                        "model": "e-tron",
+                        "model_year": 2022,
+                    }
+                    for i in range(self.config.vehicles)
+                ]
+            }
+        )
+
+    async def _status(self, request: web.Request) -> web.Response:
+        """Return the vehicle status."""
+        index = self._index(request)
+        return web.json_response(
+            {
+                "states": fake_states(index, self.tick),
+                "state": fake_state(index, self.tick),
+            }
+        )
+
+    async def _position(self, request: web.Request) -> web.Response:
+        """Return the parking position."""
+        index = self._index(request)
+        return web.json_response(fake_state(index, self.tick)["position"])
+
+    async def _trips(self, request: web.Request) -> web.Response:
+        """Return the trip history."""
+        self._index(request)
+        return web.json_response(
+            {
+                "tripDataList": [
+                    {
+                        "tripID": trip,
+                        "averageSpeed": 50 + trip % 30,
+                        "mileage": 10 + trip,
+                        "traveltime": 20 + trip,
+                        "timestamp": "2024-01-01T10:00:00+00:00",
+                    }
+                    for trip in range(self.config.trips)
+                ]
+            }
+        )
+
+    async def _details(self, request: web.Request) -> web.Response:
+        """Return a slow-changing endpoint payload."""
+        index = self._index(request)
+        name = request.match_info["name"]
+        if name not in DETAIL_ENDPOINTS:
+            raise web.HTTPNotFound()
+        return web.json_response(
+            {"endpoint": name, "vin": fake_vin(index), "lat": 48.76, "lon": 11.42}
+        )
+
+
+class FakeVehicle:
+    """Vehicle backed by the fake server."""
+
+    def __init__(self, client: FakeAudiConnect, data: dict[str, Any]) -> None:
+        """Initialize the vehicle."""
+        self._client = client
+        self.vin: str = data["vin"]
+        self.csid: str = data["csid"]
+        self.title: str = data["title"]
+        self.model: str = data["model"]
+        self.model_year: int = data["model_year"]
+        self.support_vehicle = True
+        self.states: dict[str, Any] = {}
+        self.state: dict[str, Any] = {}
+        self.api_level: dict[str, int] = {}
+
+    def set_api_level(self, name: str, level: int) -> None:
+        """Set API level."""
+        self.api_level[name] = level
+
+    async def async_update(self) -> None:
+        """Update status and position."""
+        status, position = await asyncio.gather(
+            self._client.async_request("GET", f"/vehicles/{self.vin}/status"),
+            self._client.async_request("GET", f"/vehicles/{self.vin}/position"),
+        )
+        self.states = status["states"]
+        self.state = status["state"] | {"position": position}
+
+    async def async_get_tripdata(self, kind: str) -> dict[str, Any]:
+        """Get trip data."""
+        return await self._client.async_request(
+            "GET", f"/vehicles/{self.vin}/trips/{kind}"
+        )
+
+    def __getattr__(self, name: str):
+        """Map ``async_get_<endpoint>`` to the details endpoints."""
+        endpoint = name.removeprefix("async_get_")
+        if not name.startswith("async_get_") or endpoint not in DETAIL_ENDPOINTS:
+            raise AttributeError(name)
+
+        async def _get(*args: Any) -> dict[str, Any]:
+            return await self._client.async_request(
+                "GET", f"/vehicles/{self.vin}/details/{endpoint}"
+            )
+
+        _get.__name__ = name
+        return _get
+
+
+class FakeAudiConnect:
+    """Drop-in replacement for ``audiconnectpy.AudiConnect``."""
+
+    def __init__(
+        self,
+        session: ClientSession,
+        username: str,
+        password: str,
+        country: str,
+        spin: str | None = None,
+        unit_system: str = "metric",
+        *,
+        url: str,
+    ) -> None:
+        """Initialize the client."""
+        self._session = session
+        self._username = username
+        self._password = password
+        self._url = url
+        self._token: str | None = None
+        self.vehicles: dict[str, FakeVehicle] = {}
+
+    @property
+    def is_connected(self) -> bool:
+        """Return True when logged in."""
+        return self._token is not None
+
+    async def async_request(
+        self, method: str, path: str, json: dict[str, Any] | None = None
+    ) -> Any:
+        """Send a request to the fake server."""
+        async with self._session.request(
+            method, f"{self._url}{path}", json=json
+        ) as response:
+            if response.status == 401:
+                self._token = None
+                raise AuthorizationError(await response.text())
+            if response.status >= 400:
+                raise AudiException(f"{path}: HTTP {response.status}")
+            return await response.json()
+
+    async def async_login(self) -> bool:
+        """Login."""
+        token = await self.async_request(
+            "POST",
+            "/login",
+            {"username": self._username, "password": self._password},
+        )
+        self._token = token["access_token"]
+        return True
+
+    async def async_update(self) -> None:
+        """Update vehicle list and vehicle status."""
+        if not self.is_connected:
+            await self.async_login()
+        response = await self.async_request("GET", "/vehicles")
+        for data in response["vehicles"]:
+            if data["vin"] not in self.vehicles:
+                self.vehicles[data["vin"]] = FakeVehicle(self, data)
+        await asyncio.gather(*(v.async_update() for v in self.vehicles.values()))
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Run the server until interrupted."""
+    server = FakeAudiServer(
+        FakeServerConfig(
+            vehicles=args.vehicles,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+            compress=not args.no_compression,
+        )
+    )
+    url = await server.async_start(port=args.port)
+    print(f"Fake Audi Connect server listening on {url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.async_stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--vehicles", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--no-compression", action="store_true")
+    asyncio.run(_async_main(parser.parse_args()))
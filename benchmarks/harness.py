@@ -0,0 +1,109 @@
+"""Home Assistant harness used by the benchmark suites."""
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import partial
+import time
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant import loader
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from custom_components.audiconnect.const import CONF_COUNTRY, DOMAIN
+from custom_components.audiconnect.coordinator import AudiDataUpdateCoordinator
+
+from .fake_server import FakeAudiConnect, FakeAudiServer, FakeServerConfig
+
+
+@dataclass
+class Probe:
+    """Counters collected while the integration runs."""
+
+    state_writes: int = 0
+    first_refresh: float = 0.0
+    _patches: list[Any] = field(default_factory=list)
+
+    def start(self) -> None:
+        """Install the probes."""
+        probe = self
+        write_ha_state = Entity.async_write_ha_state
+        first_refresh = AudiDataUpdateCoordinator.async_config_entry_first_refresh
+
+        def _async_write_ha_state(entity: Entity) -> None:
+            probe.state_writes += 1
+            write_ha_state(entity)
+
+        async def _async_first_refresh(coordinator: AudiDataUpdateCoordinator) -> None:
+            start = time.perf_counter()
+            try:
+                await first_refresh(coordinator)
+            finally:
+                probe.first_refresh = time.perf_counter() - start
+
+        self._patches = [
+            patch.object(Entity, "async_write_ha_state", _async_write_ha_state),
+            patch.object(
+                AudiDataUpdateCoordinator,
+                "async_config_entry_first_refresh",
+                _async_first_refresh,
+            ),
+        ]
+        for item in self._patches:
+            item.start()
+
+    def stop(self) -> None:
+        """Remove the probes."""
+        for item in self._patches:
+            item.stop()
+        self._patches.clear()
+
+
+@asynccontextmanager
+async def async_bench_hass() -> AsyncIterator[HomeAssistant]:
+    """Start a minimal Home Assistant core with custom integrations enabled."""
+    async with async_test_home_assistant() as hass:
+        hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+        yield hass
+        await hass.async_stop(force=True)
+
+
+@asynccontextmanager
+async def async_fake_cloud(
+    config: FakeServerConfig,
+) -> AsyncIterator[FakeAudiServer]:
+    """Start the fake server and route the integration to it."""
+    server = FakeAudiServer(config)
+    url = await server.async_start()
+    try:
+        with patch(
+            "audiconnectpy.AudiConnect",
+            partial(FakeAudiConnect, url=url),
+        ):
+            yield server
+    finally:
+        await server.async_stop()
+
+
+def mock_entry(hass: HomeAssistant, **options: Any) -> MockConfigEntry:
+    """Add an Audi connect config entry to Home Assistant."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Audi connect",
+        data={
+            CONF_USERNAME: "bench@example.com",
+            CONF_PASSWORD: "secret",
+            CONF_COUNTRY: "DE",
+        },
+        options=options,
+    )
+    entry.add_to_hass(hass)
+    return entry
@@ -0,0 +1,98 @@
+"""Import-time budget for the Audi Connect integration.
+
+Run from the repository root::
+
+    python -m benchmarks.import_time --budget 0.15
+
+The Home Assistant modules a running instance has already loaded are
+imported first, then ``custom_components.audiconnect`` and its platforms
+are timed in a fresh interpreter. The check fails when the integration
+exceeds the budget or when a heavy dependency is imported eagerly.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+
+PRELOADED = (
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.aiohttp_client",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.components.http",
+    "homeassistant.components.diagnostics",
+    "homeassistant.components.binary_sensor",
+    "homeassistant.components.device_tracker",
+    "homeassistant.components.lock",
+    "homeassistant.components.number",
+    "homeassistant.components.select",
+    "homeassistant.components.sensor",
+    "homeassistant.components.switch",
+)
+MODULES = (
+    "custom_components.audiconnect",
+    "custom_components.audiconnect.config_flow",
+    "custom_components.audiconnect.sensor",
+    "custom_components.audiconnect.number",
+    "custom_components.audiconnect.select",
+)
+# Modules that must only be imported once an entry is loaded, or once the
+# option or service using them is.
+DEFERRED = (
+    "audiconnectpy",
+    "bs4",
+    "custom_components.audiconnect.diagnostics",
+    "custom_components.audiconnect.memory",
+    "custom_components.audiconnect.prometheus",
+)
+
+_PROBE = """
+import importlib, json, sys, time
+for name in {preloaded!r}:
+    importlib.import_module(name)
+timings = {{}}
+for name in {modules!r}:
+    start = time.perf_counter()
+    importlib.import_module(name)
+    timings[name] = time.perf_counter() - start
+print(json.dumps({{
+    "timings": timings,
+    "eager": [name for name in {deferred!r} if name in sys.modules],
+}}))
+"""
+
+
+def measure() -> dict:
+    """Measure the import time in a fresh interpreter."""
+    probe = _PROBE.format(preloaded=PRELOADED, modules=MODULES, deferred=DEFERRED)
+    output = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, check=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=float, default=0.15, help="seconds")
+    parser.add_argument("--runs", type=int, default=5)
+    arguments = parser.parse_args()
+
+    runs = [measure() for _ in range(arguments.runs)]
+    best = {name: min(run["timings"][name] for run in runs) for name in MODULES}
+    total = sum(best.values())
+    for name, duration in best.items():
+        print(f"{name:<45} {duration * 1000:8.1f} ms")
+    print(
+        f"{'total':<45} {total * 1000:8.1f} ms (budget {arguments.budget * 1000:.0f} ms)"
+    )
+
+    failures = []
+    if total > arguments.budget:
+        failures.append("import time over budget")
+    if eager := runs[0]["eager"]:
+        failures.append(f"eagerly imported: {', '.join(eager)}")
+    if failures:
+        sys.exit("; ".join(failures))
@@ -0,0 +1,215 @@
+"""Load test of the entity fan-out and state-write cost of a refresh.
+
+Run from the repository root::
+
+    python -m benchmarks.load_test --update-baseline
+    python -m benchmarks.load_test --baseline benchmarks/load_baseline.json
+
+For 1, 25 and 100 synthetic vehicles a minimal Home Assistant core loads
+the integration against the fake server and drives refresh cycles. The
+test reports the setup time of each platform, the ``async_write_ha_state``
+calls per refresh in total and per platform, and the CPU time the event
+loop thread spends per refresh. The fake server runs on its own thread so
+its work is not counted. The run fails when a metric regresses against
+the stored baseline.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import partial
+import json
+from pathlib import Path
+import statistics
+import sys
+import threading
+import time
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import EntityPlatform
+
+from custom_components.audiconnect import PLATFORMS
+from custom_components.audiconnect.const import DOMAIN
+
+from .fake_server import FakeAudiConnect, FakeAudiServer, FakeServerConfig
+from .harness import async_bench_hass, mock_entry
+
+FLEET_SIZES = (1, 25, 100)
+BASELINE = Path(__file__).with_name("load_baseline.json")
+# Relative increase of a timing tolerated before it counts as a regression.
+DEFAULT_TOLERANCE = 0.25
+# Deterministic counts, any increase is a regression.
+COUNT_METRICS = ("setup_state_writes", "state_writes_per_refresh")
+TIME_METRICS = ("setup_s", "refresh_wall_ms", "loop_cpu_ms_per_refresh")
+
+
+@dataclass
+class FanOutProbe:
+    """State writes and platform setup time collected per platform."""
+
+    writes: Counter[str] = field(default_factory=Counter)
+    setup: defaultdict[str, float] = field(default_factory=lambda: defaultdict(float))
+    _patches: list[Any] = field(default_factory=list)
+
+    def start(self) -> None:
+        """Install the probes."""
+        probe = self
+        write_ha_state = Entity.async_write_ha_state
+        setup_entry = EntityPlatform.async_setup_entry
+
+        def _async_write_ha_state(entity: Entity) -> None:
+            probe.writes[entity.platform.domain if entity.platform else "none"] += 1
+            write_ha_state(entity)
+
+        async def _async_setup_entry(
+            platform: EntityPlatform, config_entry: ConfigEntry
+        ) -> bool:
+            start = time.perf_counter()
+            try:
+                return await setup_entry(platform, config_entry)
+            finally:
+                if platform.platform_name == DOMAIN:
+                    probe.setup[platform.domain] += time.perf_counter() - start
+
+        self._patches = [
+            patch.object(Entity, "async_write_ha_state", _async_write_ha_state),
+            patch.object(EntityPlatform, "async_setup_entry", _async_setup_entry),
+        ]
+        for item in self._patches:
+            item.start()
+
+    def stop(self) -> None:
+        """Remove the probes."""
+        for item in self._patches:
+            item.stop()
+        self._patches.clear()
+
+
+@contextmanager
+def threaded_fake_cloud(config: FakeServerConfig) -> Iterator[FakeAudiServer]:
+    """Run the fake server on its own event loop thread."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="fake_cloud", daemon=True)
+    thread.start()
+    server = FakeAudiServer(config)
+    url = asyncio.run_coroutine_threadsafe(server.async_start(), loop).result()
+    try:
+        with patch("audiconnectpy.AudiConnect", partial(FakeAudiConnect, url=url)):
+            yield server
+    finally:
+        asyncio.run_coroutine_threadsafe(server.async_stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+async def async_load_fleet(vehicles: int, refreshes: int) -> dict[str, Any]:
+    """Load test one fleet size."""
+    probe = FanOutProbe()
+    with threaded_fake_cloud(FakeServerConfig(vehicles=vehicles)):
+        async with async_bench_hass() as hass:
+            entry = mock_entry(hass)
+            probe.start()
+            try:
+                start = time.perf_counter()
+                if not await hass.config_entries.async_setup(entry.entry_id):
+                    raise RuntimeError(f"Setup failed with {vehicles} vehicles")
+                await hass.async_block_till_done()
+                setup = time.perf_counter() - start
+                setup_writes = sum(probe.writes.values())
+                entities = len(hass.states.async_entity_ids())
+
+                coordinator = hass.data[DOMAIN][entry.entry_id]
+                probe.writes.clear()
+                wall, cpu = [], []
+                for _ in range(refreshes):
+                    start, start_cpu = time.perf_counter(), time.thread_time()
+                    await coordinator.async_refresh()
+                    await hass.async_block_till_done()
+                    cpu.append(time.thread_time() - start_cpu)
+                    wall.append(time.perf_counter() - start)
+            finally:
+                probe.stop()
+            await hass.config_entries.async_unload(entry.entry_id)
+
+    return {
+        "vehicles": vehicles,
+        "entities": entities,
+        "setup_s": round(setup, 4),
+        "platform_setup_s": {
+            platform.value: round(probe.setup.get(platform.value, 0.0), 4)
+            for platform in PLATFORMS
+        },
+        "setup_state_writes": setup_writes,
+        "state_writes_per_refresh": sum(probe.writes.values()) / refreshes,
+        "state_writes_by_platform": {
+            domain: count / refreshes for domain, count in sorted(probe.writes.items())
+        },
+        "refresh_wall_ms": round(statistics.median(wall) * 1000, 3),
+        "loop_cpu_ms_per_refresh": round(statistics.median(cpu) * 1000, 3),
+    }
+
+
+def _metrics(result: dict[str, Any]) -> dict[str, tuple[float, bool]]:
+    """Return the compared metrics of a fleet and whether they are counts."""
+    metrics = {name: (result[name], True) for name in COUNT_METRICS}
+    metrics.update({name: (result[name], False) for name in TIME_METRICS})
+    for platform, duration in result["platform_setup_s"].items():
+        metrics[f"platform_setup_s.{platform}"] = (duration, False)
+    return metrics
+
+
+def regressions(
+    current: dict[str, Any], baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    """Return the metrics worse than the baseline."""
+    found = []
+    for size, result in current["results"].items():
+        if (before := baseline["results"].get(size)) is None:
+            continue
+        previous = _metrics(before)
+        for name, (value, count) in _metrics(result).items():
+            if (old := previous.get(name)) is None:
+                continue
+            limit = old[0] if count else old[0] * (1 + tolerance)
+            if value > limit:
+                found.append(f"{size} vehicles: {name} {old[0]} -> {value}")
+    return found
+
+
+async def async_main(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the load test."""
+    return {
+        "meta": {"refreshes": args.refreshes},
+        "results": {
+            str(vehicles): await async_load_fleet(vehicles, args.refreshes)
+            for vehicles in args.vehicles
+        },
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vehicles", type=int, nargs="+", default=FLEET_SIZES)
+    parser.add_argument("--refreshes", type=int, default=10)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--update-baseline", action="store_true")
+    arguments = parser.parse_args()
+
+    report = asyncio.run(async_main(arguments))
+    print(json.dumps(report, indent=2))
+    if arguments.update_baseline:
+        arguments.baseline.write_text(json.dumps(report, indent=2))
+    elif arguments.baseline.exists():
+        baseline = json.loads(arguments.baseline.read_text())
+        if found := regressions(report, baseline, arguments.tolerance):
+            sys.exit("Regressions:\n" + "\n".join(found))
+        print(f"No regression against {arguments.baseline}")
@@ -0,0 +1,196 @@
+"""Replay of recorded Audi Connect API traffic.
+
+Record the traffic of a real account by enabling *Record the API traffic*
+in the integration options; the exchanges are appended after each refresh
+to ``<config>/audiconnect/traffic_<entry_id>.jsonl.gz``. Then run from the
+repository root::
+
+    python -m benchmarks.replay traffic.jsonl.gz --refreshes 20
+    python -m benchmarks.replay traffic.jsonl.gz --speed 1
+
+The real client library and the integration run unmodified on top of a
+local server answering each request with the next recorded response of
+the same method, host and path. ``--speed 1`` keeps the recorded latency
+of every exchange, ``--speed 10`` divides it by ten and the default
+``--speed 0`` answers at once, so only the integration overhead remains.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import defaultdict
+from functools import partial
+import json
+from pathlib import Path
+import statistics
+import time
+from typing import Any
+from unittest.mock import patch
+
+from aiohttp import ClientRequest, hdrs, web
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from yarl import URL
+
+from custom_components.audiconnect.const import DOMAIN
+from custom_components.audiconnect.traffic import read_recording
+
+from .harness import Probe, async_bench_hass, mock_entry
+
+# Method, host and path of a recorded request.
+Key = tuple[str, str, str]
+
+
+def replay_request_class(base: URL) -> type[ClientRequest]:
+    """Return a request class sending every request to the replay server."""
+
+    class ReplayRequest(ClientRequest):
+        """Request rewritten to ``<base>/<host><path>``."""
+
+        def __init__(self, method: str, url: URL, *args: Any, **kwargs: Any) -> None:
+            if url.host != base.host or url.port != base.port:
+                url = base.with_path(f"/{url.host}{url.path}").with_query(url.query)
+            super().__init__(method, url, *args, **kwargs)
+
+    return ReplayRequest
+
+
+class ReplayServer:
+    """aiohttp application answering with the recorded responses."""
+
+    def __init__(self, records: list[dict[str, Any]], speed: float = 0.0) -> None:
+        """Index the recorded exchanges by method, host and path."""
+        self.speed = speed
+        self.hits = 0
+        self.misses: dict[str, int] = defaultdict(int)
+        self._exchanges: dict[Key, list[dict[str, Any]]] = defaultdict(list)
+        self._served: dict[Key, int] = defaultdict(int)
+        for record in records:
+            url = URL(record["url"])
+            self._exchanges[(record["method"], url.host, url.path)].append(record)
+        self._runner: web.AppRunner | None = None
+        self.url = URL()
+        self.app = web.Application()
+        self.app.add_routes([web.route("*", "/{host}/{path:.*}", self._replay)])
+
+    async def async_start(self, host: str = "127.0.0.1", port: int = 0) -> URL:
+        """Start the server and return its base url."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        sockets = site._server.sockets  # pylint: disable=protected-access
+        self.url = URL(f"http://{host}:{sockets[0].getsockname()[1]}")
+        return self.url
+
+    async def async_stop(self) -> None:
+        """Stop the server."""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _replay(self, request: web.Request) -> web.Response:
+        """Answer with the next recorded response, the last one once exhausted."""
+        key = (
+            request.method,
+            request.match_info["host"],
+            f"/{request.match_info['path']}",
+        )
+        if not (exchanges := self._exchanges.get(key)):
+            self.misses[" ".join(key)] += 1
+            return web.json_response({"error": "not recorded"}, status=404)
+        index = min(self._served[key], len(exchanges) - 1)
+        self._served[key] += 1
+        self.hits += 1
+        record = exchanges[index]
+        if self.speed:
+            await asyncio.sleep(record["duration"] / self.speed)
+        headers = {}
+        if location := record.get("location"):
+            headers[hdrs.LOCATION] = location
+        if "json" in record:
+            return web.Response(
+                status=record["status"],
+                text=json.dumps(record["json"]),
+                content_type="application/json",
+                headers=headers,
+            )
+        return web.Response(
+            status=record["status"],
+            text=record.get("text", ""),
+            content_type=(record.get("content_type") or "text/plain").split(";")[0],
+            headers=headers,
+        )
+
+
+async def async_replay(path: Path, refreshes: int, speed: float) -> dict[str, Any]:
+    """Run the integration against a recording."""
+    records = await asyncio.to_thread(read_recording, path)
+    server = ReplayServer(records, speed)
+    base = await server.async_start()
+    probe = Probe()
+    try:
+        async with async_bench_hass() as hass:
+            with patch(
+                "custom_components.audiconnect.coordinator.async_create_clientsession",
+                partial(
+                    async_create_clientsession,
+                    request_class=replay_request_class(base),
+                ),
+            ):
+                entry = mock_entry(hass)
+                probe.start()
+                try:
+                    start = time.perf_counter()
+                    if not await hass.config_entries.async_setup(entry.entry_id):
+                        raise RuntimeError("Setup failed on the recording")
+                    await hass.async_block_till_done()
+                    setup = time.perf_counter() - start
+                    coordinator = hass.data[DOMAIN][entry.entry_id]
+                    probe.state_writes = 0
+                    durations = []
+                    for _ in range(refreshes):
+                        start = time.perf_counter()
+                        await coordinator.async_refresh()
+                        await hass.async_block_till_done()
+                        durations.append(time.perf_counter() - start)
+                    vehicles = len(coordinator.data or {})
+                    entities = len(hass.states.async_entity_ids())
+                finally:
+                    probe.stop()
+                await hass.config_entries.async_unload(entry.entry_id)
+    finally:
+        await server.async_stop()
+
+    return {
+        "recording": str(path),
+        "exchanges": len(records),
+        "speed": speed,
+        "vehicles": vehicles,
+        "entities": entities,
+        "setup_s": round(setup, 4),
+        "first_refresh_s": round(probe.first_refresh, 4),
+        "refresh_median_s": round(statistics.median(durations), 4)
+        if durations
+        else None,
+        "state_writes_per_refresh": probe.state_writes / refreshes
+        if refreshes
+        else None,
+        "replayed": server.hits,
+        "not_recorded": dict(server.misses),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording", type=Path)
+    parser.add_argument("--refreshes", type=int, default=20)
+    parser.add_argument("--speed", type=float, default=0.0)
+    arguments = parser.parse_args()
+    print(
+        json.dumps(
+            asyncio.run(
+                async_replay(arguments.recording, arguments.refreshes, arguments.speed)
+            ),
+            indent=2,
+        )
+    )
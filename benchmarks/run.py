@@ -0,0 +1,186 @@
+"""Performance benchmark suite for the Audi Connect integration.
+
+Run from the repository root::
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --compare previous.json
+
+For every fleet size the suite measures the first refresh, the entity
+setup, the steady-state refresh latency, the number of state writes per
+refresh, the bytes received per refresh (on the wire and once
+decompressed), the memory held after setup (in total and per entity) and
+the peak traced memory. Results are written as JSON so they can be
+compared between releases.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import datetime, timezone
+import json
+import math
+from pathlib import Path
+import platform
+import statistics
+import time
+import tracemalloc
+from typing import Any
+
+from homeassistant.const import __version__ as HA_VERSION
+
+from custom_components.audiconnect.const import DOMAIN
+
+from .fake_server import FakeServerConfig
+from .harness import Probe, async_bench_hass, async_fake_cloud, mock_entry
+
+MANIFEST = Path(__file__).parents[1] / "custom_components" / DOMAIN / "manifest.json"
+FLEET_SIZES = (1, 10, 100)
+
+# Metrics where a higher value is a regression.
+LOWER_IS_BETTER = (
+    "first_refresh_s",
+    "entity_setup_s",
+    "refresh_median_s",
+    "refresh_p95_s",
+    "state_writes_per_refresh",
+    "setup_memory_kib",
+    "memory_per_entity_b",
+    "peak_memory_kib",
+    "login_loop_blocked_s",
+    "wire_bytes_per_refresh",
+)
+
+
+def _received(coordinator: Any) -> tuple[int, int]:
+    """Return the bytes received on the wire and once decompressed."""
+    endpoints = coordinator.metrics.endpoints.values()
+    return (
+        sum(metrics.wire_bytes for metrics in endpoints),
+        sum(metrics.payload_bytes for metrics in endpoints),
+    )
+
+
+async def async_bench_fleet(
+    vehicles: int,
+    refreshes: int,
+    latency: float,
+    error_rate: float,
+    compress: bool = True,
+) -> dict[str, Any]:
+    """Benchmark one fleet size."""
+    config = FakeServerConfig(
+        vehicles=vehicles, latency=latency, error_rate=error_rate, compress=compress
+    )
+    probe = Probe()
+    async with async_bench_hass() as hass, async_fake_cloud(config) as server:
+        entry = mock_entry(hass)
+        probe.start()
+        tracemalloc.start()
+        try:
+            start = time.perf_counter()
+            if not await hass.config_entries.async_setup(entry.entry_id):
+                raise RuntimeError(f"Setup failed with {vehicles} vehicles")
+            await hass.async_block_till_done()
+            setup = time.perf_counter() - start
+            setup_writes = probe.state_writes
+            entities = len(hass.states.async_entity_ids())
+            setup_memory, _ = tracemalloc.get_traced_memory()
+
+            coordinator = hass.data[DOMAIN][entry.entry_id]
+            login = coordinator.logins[0] if coordinator.logins else {}
+            durations = []
+            probe.state_writes = 0
+            wire, decoded = _received(coordinator)
+            for _ in range(refreshes):
+                start = time.perf_counter()
+                await coordinator.async_refresh()
+                await hass.async_block_till_done()
+                durations.append(time.perf_counter() - start)
+            _, peak = tracemalloc.get_traced_memory()
+            wire_end, decoded_end = _received(coordinator)
+        finally:
+            tracemalloc.stop()
+            probe.stop()
+
+        await hass.config_entries.async_unload(entry.entry_id)
+
+    durations.sort()
+    return {
+        "vehicles": vehicles,
+        "entities": entities,
+        "first_refresh_s": round(probe.first_refresh, 4),
+        "entity_setup_s": round(setup - probe.first_refresh, 4),
+        "setup_state_writes": setup_writes,
+        "refresh_median_s": round(statistics.median(durations), 4),
+        "refresh_p95_s": round(durations[math.ceil(len(durations) * 0.95) - 1], 4),
+        "state_writes_per_refresh": probe.state_writes / refreshes,
+        "login_loop_blocked_s": login.get("loop_blocked"),
+        "wire_bytes_per_refresh": (wire_end - wire) / refreshes,
+        "decoded_bytes_per_refresh": (decoded_end - decoded) / refreshes,
+        "setup_memory_kib": round(setup_memory / 1024, 1),
+        "memory_per_entity_b": round(setup_memory / entities) if entities else None,
+        "peak_memory_kib": round(peak / 1024, 1),
+        "requests": dict(server.requests),
+    }
+
+
+def compare(current: dict[str, Any], previous: dict[str, Any]) -> list[str]:
+    """Return a human readable comparison of two result files."""
+    lines = [
+        f"{'vehicles':>8} {'metric':<26} {'previous':>12} {'current':>12} {'delta':>8}"
+    ]
+    for size, result in current["results"].items():
+        if (before := previous["results"].get(size)) is None:
+            continue
+        for metric in LOWER_IS_BETTER:
+            old, new = before.get(metric), result.get(metric)
+            if old is None or new is None:
+                continue
+            delta = f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+            lines.append(f"{size:>8} {metric:<26} {old:>12} {new:>12} {delta:>8}")
+    return lines
+
+
+async def async_main(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the suite."""
+    results = {}
+    for vehicles in args.vehicles:
+        results[str(vehicles)] = await async_bench_fleet(
+            vehicles,
+            args.refreshes,
+            args.latency,
+            args.error_rate,
+            not args.no_compression,
+        )
+    return {
+        "meta": {
+            "version": json.loads(MANIFEST.read_text())["version"],
+            "homeassistant": HA_VERSION,
+            "python": platform.python_version(),
+            "date": datetime.now(timezone.utc).isoformat(),
+            "refreshes": args.refreshes,
+            "latency": args.latency,
+            "error_rate": args.error_rate,
+            "compression": not args.no_compression,
+        },
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vehicles", type=int, nargs="+", default=FLEET_SIZES)
+    parser.add_argument("--refreshes", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--no-compression", action="store_true")
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--compare", type=Path)
+    arguments = parser.parse_args()
+
+    report = asyncio.run(async_main(arguments))
+    print(json.dumps(report, indent=2))
+    if arguments.output:
+        arguments.output.write_text(json.dumps(report, indent=2))
+    if arguments.compare:
+        print("\n".join(compare(report, json.loads(arguments.compare.read_text()))))
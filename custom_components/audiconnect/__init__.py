@@ -2,15 +2,15 @@
 from __future__ import annotations
 
 import logging
+import time
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
 
-from .const import DOMAIN
-from .coordinator import AudiConnectDataUpdateCoordinator
+from .const import CONF_METRICS_ENDPOINT, DOMAIN
+from .coordinator import AudiDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,22 +29,41 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Audi Connect from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
-    session = async_get_clientsession(hass)
-
     # Initialize coordinator
-    coordinator = AudiConnectDataUpdateCoordinator(hass, entry, session)
+    coordinator = AudiDataUpdateCoordinator(hass, entry)
 
     # Fetch initial data
+    start = time.monotonic()
     try:
         await coordinator.async_config_entry_first_refresh()
     except Exception as ex:
         _LOGGER.error("Unable to connect to Audi Connect: %s", ex)
         raise ConfigEntryNotReady from ex
+    coordinator.startup["first_refresh"] = (
+        time.monotonic()
+        - start
+        - coordinator.startup.get("import_client", 0)
+        - coordinator.startup.get("ramp", 0)
+    )
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    if entry.options.get(CONF_METRICS_ENDPOINT):
+        # Imports the http component, only needed with the endpoint enabled
+        from .prometheus import async_register_metrics_view
+
+        async_register_metrics_view(hass)
 
     # Set up platforms using the new method (HA 2025 compatible)
+    start = time.monotonic()
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    coordinator.startup["platform_setup"] = time.monotonic() - start
+    _LOGGER.debug(
+        "Startup of %s: import %.3fs, first refresh %.3fs, platform setup %.3fs",
+        entry.title,
+        coordinator.startup.get("import_client", 0),
+        coordinator.startup["first_refresh"],
+        coordinator.startup["platform_setup"],
+    )
 
     # Register services
     await _async_register_services(hass, coordinator)
@@ -62,7 +81,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "refresh_data", 
         "execute_vehicle_action", 
         "turn_on_action", 
-        "turn_off_action"
+        "turn_off_action",
+        "charging_sessions",
+        "start_memory_profile",
+        "stop_memory_profile",
     ]
     
     for service_name in services_to_remove:
@@ -79,7 +101,23 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Update listener for options."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    if not await coordinator.async_apply_options(entry):
+        await hass.config_entries.async_reload(entry.entry_id)
+    elif entry.options.get(CONF_METRICS_ENDPOINT):
+        from .prometheus import async_register_metrics_view
+
+        async_register_metrics_view(hass)
+
+
+def _resolve_vehicle(hass: HomeAssistant, target: str):
+    """Return the coordinator and VIN of a vehicle of any account."""
+    for coordinator in hass.data[DOMAIN].values():
+        try:
+            return coordinator, coordinator.resolve_vin(target)
+        except HomeAssistantError:
+            continue
+    raise HomeAssistantError(f"Unknown vehicle {target}")
 
 
 async def _async_register_services(hass: HomeAssistant, coordinator) -> None:
@@ -87,13 +125,20 @@ async def _async_register_services(hass: HomeAssistant, coordinator) -> None:
     
     async def refresh_data(call):
         """Service to refresh vehicle data."""
+        from .wakeup import PRIORITY_NORMAL
+
         vin = call.data.get("vin")
-        if vin and hasattr(coordinator, 'connection') and coordinator.connection:
-            try:
-                await coordinator.connection.refresh_vehicle_data(vin)
-                await coordinator.async_request_refresh()
-            except Exception as ex:
-                _LOGGER.error("Failed to refresh data for VIN %s: %s", vin, ex)
+        try:
+            # Wakes the vehicle: limited by its budget, joins a running wake.
+            owner, _vin = _resolve_vehicle(hass, vin)
+            await owner.async_refresh_vehicle(
+                vin, call.data.get("priority", PRIORITY_NORMAL)
+            )
+        except HomeAssistantError:
+            raise
+        except Exception as ex:
+            _LOGGER.error("Failed to refresh data for VIN %s: %s", vin, ex)
+            raise HomeAssistantError(f"Failed to refresh data: {ex}") from ex
 
     async def execute_vehicle_action(call):
         """Service to execute vehicle actions."""
@@ -146,8 +191,64 @@ async def _async_register_services(hass: HomeAssistant, coordinator) -> None:
             except Exception as ex:
                 _LOGGER.error("Failed to turn off %s for VIN %s: %s", action, vin, ex)
 
+    async def charging_sessions(call: ServiceCall) -> dict:
+        """Service returning the latest charging sessions by device id."""
+        target = call.data.get("vin")
+        limit = int(call.data.get("limit", 10))
+        if target is not None:
+            owner, _vin = _resolve_vehicle(hass, target)
+            return {"sessions": owner.charging_sessions(target, limit)}
+        sessions = {}
+        for owner in hass.data[DOMAIN].values():
+            sessions.update(owner.charging_sessions(None, limit))
+        return {"sessions": sessions}
+
+    async def start_memory_profile(call: ServiceCall) -> None:
+        """Service starting the memory profiling."""
+        from .memory import DEFAULT_FRAMES, async_start_profiling
+
+        await async_start_profiling(
+            hass, int(call.data.get("frames", DEFAULT_FRAMES))
+        )
+
+    async def stop_memory_profile(call: ServiceCall) -> dict:
+        """Service stopping the memory profiling and returning its report."""
+        from .memory import DEFAULT_TOP, async_stop_profiling
+
+        return await async_stop_profiling(
+            hass, hass.data[DOMAIN].values(), int(call.data.get("top", DEFAULT_TOP))
+        )
+
+    def watched(name, handler):
+        """Time a service handler when the stall watchdog is enabled."""
+
+        async def wrapper(call):
+            if coordinator.watchdog is None:
+                return await handler(call)
+            return await coordinator.watchdog.async_run(
+                f"service.{name}", handler(call)
+            )
+
+        return wrapper
+
     # Register services
-    hass.services.async_register(DOMAIN, "refresh_data", refresh_data)
-    hass.services.async_register(DOMAIN, "execute_vehicle_action", execute_vehicle_action)
-    hass.services.async_register(DOMAIN, "turn_on_action", turn_on_action)
-    hass.services.async_register(DOMAIN, "turn_off_action", turn_off_action)
\ No newline at end of file
+    for name, handler in (
+        ("refresh_data", refresh_data),
+        ("execute_vehicle_action", execute_vehicle_action),
+        ("turn_on_action", turn_on_action),
+        ("turn_off_action", turn_off_action),
+        ("start_memory_profile", start_memory_profile),
+    ):
+        hass.services.async_register(DOMAIN, name, watched(name, handler))
+    hass.services.async_register(
+        DOMAIN,
+        "charging_sessions",
+        watched("charging_sessions", charging_sessions),
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "stop_memory_profile",
+        watched("stop_memory_profile", stop_memory_profile),
+        supports_response=SupportsResponse.ONLY,
+    )
\ No newline at end of file
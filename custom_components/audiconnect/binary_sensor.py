@@ -14,6 +14,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, BINARY_SENSOR_TYPES
+from .loop_monitor import watched
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,23 +25,21 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the binary sensor platform."""
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
-    connection = hass.data[DOMAIN][config_entry.entry_id]["connection"]
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    connection = coordinator.api
 
-    entities = []
-    
-    for vehicle in coordinator.data or []:
-        for sensor_type in BINARY_SENSOR_TYPES:
-            entities.append(
-                AudiConnectBinarySensor(
-                    coordinator,
-                    connection,
-                    vehicle,
-                    sensor_type,
-                )
+    def vehicle_entities(vin: str) -> list[AudiConnectBinarySensor]:
+        return [
+            AudiConnectBinarySensor(
+                coordinator,
+                connection,
+                coordinator.data[vin],
+                sensor_type,
             )
+            for sensor_type in BINARY_SENSOR_TYPES
+        ]
 
-    async_add_entities(entities)
+    coordinator.async_add_vehicle_entities(async_add_entities, vehicle_entities)
 
 
 class AudiConnectBinarySensor(CoordinatorEntity, BinarySensorEntity):
@@ -59,6 +58,7 @@ class AudiConnectBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._vehicle = vehicle
         self._sensor_type = sensor_type
         self._attr_unique_id = f"{vehicle.vin}_{sensor_type}"
+        self._attr_device_info = coordinator.vehicle_meta(vehicle.vin).device_info
         
         sensor_config = BINARY_SENSOR_TYPES[sensor_type]
         self._attr_name = f"{vehicle.title} {sensor_config['name']}"
@@ -70,56 +70,25 @@ class AudiConnectBinarySensor(CoordinatorEntity, BinarySensorEntity):
             )
 
     @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._vehicle.vin)},
-            "name": self._vehicle.title,
-            "manufacturer": "Audi",
-            "model": self._vehicle.model,
-            "sw_version": self._vehicle.model_year,
-        }
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return (
+            super().available
+            and self.coordinator.vehicle_available(self._vehicle.vin)
+        )
 
-    @property
+    @watched
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        if not self._vehicle or not self._vehicle.state:
+        if (view := self.coordinator.views.get(self._vehicle.vin)) is None:
             return None
+        return view.binary_sensors.get(self._sensor_type)
 
-        vehicle_state = self._vehicle.state
-        
-        # Map binary sensor types to vehicle state attributes
-        if self._sensor_type == "doors_locked":
-            return vehicle_state.get("overallLockStatus") == "locked"
-        elif self._sensor_type == "windows_closed":
-            return not vehicle_state.get("anyWindowOpen", False)
-        elif self._sensor_type == "any_door_unlocked":
-            return vehicle_state.get("anyDoorUnlocked", False)
-        elif self._sensor_type == "any_window_open":
-            return vehicle_state.get("anyWindowOpen", False)
-        elif self._sensor_type == "trunk_unlocked":
-            return vehicle_state.get("trunkUnlocked", False)
-        elif self._sensor_type == "hood_open":
-            return vehicle_state.get("hoodOpen", False)
-        elif self._sensor_type == "is_moving":
-            return vehicle_state.get("isMoving", False)
-        
-        return None
-
-    @property
+    @watched
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional state attributes."""
-        if not self._vehicle or not self._vehicle.state:
+        if (view := self.coordinator.views.get(self._vehicle.vin)) is None:
             return None
-            
-        attributes = {}
-        
-        # Add last update time
-        if hasattr(self._vehicle, 'last_update_time'):
-            attributes["last_update"] = self._vehicle.last_update_time
-            
-        # Add VIN (last 4 digits only for privacy)
-        if self._vehicle.vin:
-            attributes["vin"] = f"***{self._vehicle.vin[-4:]}"
-            
-        return attributes if attributes else None
\ No newline at end of file
+        return self.coordinator.stale_attributes(
+            self._vehicle.vin, view.attributes["binary_sensor"] or None
+        )
@@ -0,0 +1,148 @@
+"""Read-through cache of slow-changing Audi Connect API responses."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+import time
+from typing import Any, TypeVar
+
+from homeassistant.helpers.json import json_bytes
+
+_T = TypeVar("_T")
+
+# Time to live (seconds) of the endpoints worth caching.
+TTL_STATIC = 24 * 3600
+TTL_SLOW = 3600
+TTL_TIMER = 900
+CACHE_TTL = {
+    "vehicle_details": TTL_STATIC,
+    "capabilities": TTL_STATIC,
+    "operations_list": TTL_STATIC,
+    "identity_data": TTL_STATIC,
+    "users": TTL_SLOW,
+    "vehicule_users": TTL_SLOW,
+    "fences": TTL_SLOW,
+    "fences_config": TTL_SLOW,
+    "speed_config": TTL_SLOW,
+    "climater_timer": TTL_TIMER,
+}
+DEFAULT_MAX_ENTRIES = 256
+# Time to live (seconds) of a failed fetch: the error is raised again
+# meanwhile instead of calling the endpoint.
+FAILURE_TTL = 300
+
+
+@dataclass
+class CacheEntry:
+    """A cached response."""
+
+    value: Any
+    expires: float
+    size: int
+
+
+def payload_size(value: Any) -> int:
+    """Return the size of a response once encoded as JSON."""
+    try:
+        return len(json_bytes(value if isinstance(value, dict | list) else vars(value)))
+    except TypeError:
+        return 0
+
+
+class ResponseCache:
+    """Bounded LRU cache with a time to live per endpoint."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize the cache."""
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_saved = 0
+        self.failures_served = 0
+        self._entries: OrderedDict[tuple[Hashable, ...], CacheEntry] = OrderedDict()
+        self._failures: dict[tuple[Hashable, ...], tuple[Exception, float]] = {}
+
+    @property
+    def hit_ratio(self) -> float | None:
+        """Return the share of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+    async def async_get(
+        self,
+        vin: str,
+        endpoint: str,
+        fetch: Callable[..., Awaitable[_T]],
+        *args: Any,
+        min_ttl: float = 0,
+    ) -> _T:
+        """Return the response of an endpoint, fetching it when stale.
+
+        ``min_ttl`` also caches the endpoints without a time to live tier.
+        A failed fetch raises the same error until ``FAILURE_TTL`` passed.
+        """
+        if not (ttl := max(CACHE_TTL.get(endpoint, 0), min_ttl)):
+            return await fetch(*args)
+        key = (vin, endpoint, *args)
+        now = time.monotonic()
+        if (entry := self._entries.get(key)) is not None and entry.expires > now:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.bytes_saved += entry.size
+            return entry.value
+        if (failure := self._failures.get(key)) is not None:
+            if failure[1] > now:
+                self.failures_served += 1
+                raise failure[0].with_traceback(None)
+            del self._failures[key]
+        self.misses += 1
+        try:
+            value = await fetch(*args)
+        except Exception as error:
+            self._failures[key] = (error, now + min(ttl, FAILURE_TTL))
+            raise
+        self.purge()
+        self._entries[key] = CacheEntry(value, now + ttl, payload_size(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def purge(self) -> None:
+        """Drop the expired entries."""
+        now = time.monotonic()
+        for key in [
+            key for key, entry in self._entries.items() if entry.expires <= now
+        ]:
+            del self._entries[key]
+        for key in [
+            key for key, (_error, expires) in self._failures.items() if expires <= now
+        ]:
+            del self._failures[key]
+
+    def invalidate(self, vin: str | None = None) -> None:
+        """Drop the entries of a vehicle, or all entries."""
+        for key in [key for key in self._entries if vin is None or key[0] == vin]:
+            del self._entries[key]
+        for key in [key for key in self._failures if vin is None or key[0] == vin]:
+            del self._failures[key]
+
+    def values(self, vin: str) -> list[Any]:
+        """Return the cached responses of a vehicle."""
+        return [entry.value for key, entry in self._entries.items() if key[0] == vin]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cache counters."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hit_ratio,
+            "evictions": self.evictions,
+            "bytes_saved": self.bytes_saved,
+            "failures": len(self._failures),
+            "failures_served": self.failures_served,
+        }
@@ -0,0 +1,192 @@
+"""Charging sessions and energy integrated from the polled charging power."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+MAX_SESSIONS = 50
+# Longest interval (seconds) integrated between two samples; the rest of a
+# longer interval is counted as a gap instead of guessing the power.
+MAX_GAP = 1800
+CHARGING = "charging"
+
+
+def _float(value: Any) -> float | None:
+    """Return a state value as a float."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class ChargingSession:
+    """A charging session."""
+
+    started: str
+    soc_start: float | None = None
+    ended: str | None = None
+    soc_end: float | None = None
+    energy_kwh: float = 0.0
+    peak_power_kw: float = 0.0
+    gap_seconds: float = 0.0
+
+
+@dataclass
+class VehicleCharging:
+    """Charging state of a vehicle."""
+
+    total_kwh: float = 0.0
+    session: ChargingSession | None = None
+    last_session: ChargingSession | None = None
+    history: deque[ChargingSession] = field(
+        default_factory=lambda: deque(maxlen=MAX_SESSIONS)
+    )
+    sample: tuple[datetime, float] | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> VehicleCharging:
+        """Restore a stored state."""
+        history = [ChargingSession(**session) for session in data["history"]]
+        charging = cls(
+            total_kwh=data["total_kwh"],
+            history=deque(history, maxlen=MAX_SESSIONS),
+            last_session=history[-1] if history else None,
+        )
+        if session := data.get("session"):
+            charging.session = ChargingSession(**session)
+        if sample := data.get("sample"):
+            charging.sample = (dt_util.parse_datetime(sample[0]), sample[1])
+        return charging
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state to store."""
+        return {
+            "total_kwh": self.total_kwh,
+            "session": asdict(self.session) if self.session else None,
+            "history": [asdict(session) for session in self.history],
+            "sample": [self.sample[0].isoformat(), self.sample[1]]
+            if self.sample
+            else None,
+        }
+
+
+class ChargingTracker:
+    """Detect charging sessions and integrate their energy between polls.
+
+    The energy is the trapezoid integral of the charging power over the
+    samples. An interval longer than ``MAX_GAP`` is only integrated over
+    its first ``MAX_GAP`` seconds; the remainder is recorded as a gap.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the tracker."""
+        self.vehicles: dict[str, VehicleCharging] = {}
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.charging"
+        )
+
+    async def async_load(self) -> None:
+        """Load the stored sessions."""
+        if data := await self._store.async_load():
+            self.vehicles = {
+                vin: VehicleCharging.from_dict(vehicle) for vin, vehicle in data.items()
+            }
+
+    def update(
+        self, vin: str, states: dict[str, Any], now: datetime | None = None
+    ) -> None:
+        """Add a sample of the charging state of a vehicle."""
+        if "charging_power" not in states:
+            return
+        now = now or dt_util.utcnow()
+        charging = self.vehicles.setdefault(vin, VehicleCharging())
+        is_charging = states.get("charging_state") == CHARGING
+        power = (_float(states.get("charging_power")) or 0.0) / 1000
+        soc = _float(states.get("state_of_charge"))
+        if charging.session is None and not is_charging:
+            return
+        if charging.sample and charging.sample[0] >= now:
+            return
+
+        if session := charging.session:
+            if charging.sample:
+                last, last_power = charging.sample
+                seconds = (now - last).total_seconds()
+                if seconds > MAX_GAP:
+                    session.gap_seconds += seconds - MAX_GAP
+                    seconds = MAX_GAP
+                energy = (last_power + power) / 2 * seconds / 3600
+                session.energy_kwh += energy
+                charging.total_kwh += energy
+            session.peak_power_kw = max(session.peak_power_kw, power)
+            if not is_charging:
+                session.ended = now.isoformat()
+                session.soc_end = soc
+                charging.history.append(session)
+                charging.last_session = session
+                charging.session = None
+        elif is_charging:
+            charging.session = ChargingSession(
+                now.isoformat(), soc_start=soc, peak_power_kw=power
+            )
+        charging.sample = (now, power) if charging.session else None
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def session_energy(self, vin: str) -> float | None:
+        """Return the energy of the running or last session."""
+        if (charging := self.vehicles.get(vin)) is None:
+            return None
+        if session := charging.session or charging.last_session:
+            return round(session.energy_kwh, 3)
+        return None
+
+    def session_start(self, vin: str) -> datetime | None:
+        """Return the start of the running or last session."""
+        if (charging := self.vehicles.get(vin)) is None:
+            return None
+        if session := charging.session or charging.last_session:
+            return dt_util.parse_datetime(session.started)
+        return None
+
+    def total_energy(self, vin: str) -> float | None:
+        """Return the energy charged since the tracking started."""
+        if (charging := self.vehicles.get(vin)) is None:
+            return None
+        return round(charging.total_kwh, 3)
+
+    def sessions(
+        self,
+        vin: str | None = None,
+        limit: int = 10,
+        key: Callable[[str], str] = str,
+    ) -> dict[str, Any]:
+        """Return the latest sessions of the vehicles, newest first.
+
+        The vehicles are listed under `key(vin)`, so callers can show them
+        without their VIN.
+        """
+        result = {}
+        for current, charging in self.vehicles.items():
+            if vin is not None and current != vin:
+                continue
+            sessions = list(reversed(charging.history))
+            if charging.session:
+                sessions.insert(0, charging.session)
+            result[key(current)] = [asdict(session) for session in sessions[:limit]]
+        return result
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {vin: charging.as_dict() for vin, charging in self.vehicles.items()}
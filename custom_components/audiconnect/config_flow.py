@@ -4,7 +4,6 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from audiconnectpy import AudiConnect, AudiException, AuthorizationError
 import voluptuous as vol
 
 from homeassistant import config_entries
@@ -21,14 +20,32 @@ from .const import (
     API_LEVEL_VENTILATION,
     API_LEVEL_WINDOWSHEATING,
     CONF_COUNTRY,
+    CONF_DIAGNOSTICS_SECTIONS,
+    CONF_MAX_STALENESS,
+    CONF_METRICS_ENDPOINT,
+    CONF_PUSH_URL,
+    CONF_RECORD_TRAFFIC,
     CONF_SCAN_INTERVAL,
+    CONF_STALL_THRESHOLD,
+    CONF_STALL_WATCHDOG,
+    CONF_WAKEUP_DAILY,
+    CONF_WAKEUP_HOURLY,
+    CONF_ZONE_EVENTS,
     CONF_VEHICLE,
     COUNTRY_CODE,
+    DEFAULT_MAX_STALENESS,
+    DEFAULT_STALL_THRESHOLD,
+    DEFAULT_WAKEUP_DAILY,
+    DEFAULT_WAKEUP_HOURLY,
+    DIAGNOSTICS_SECTIONS,
     DOMAIN,
     MENU_OTHER,
     MENU_SAVE,
     MENU_VEHICLES,
 )
+from .coordinator import api_unit_system, async_import_client, store_handover
+from .loop_monitor import LoopBlockProbe
+from .metrics import ApiMetrics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -60,21 +77,34 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle the initial step."""
         errors = {}
         if user_input is not None:
+            client = await async_import_client(self.hass)
+            self._async_abort_entries_match(
+                {
+                    CONF_USERNAME: user_input[CONF_USERNAME],
+                },
+            )
+            metrics = ApiMetrics()
+            session = async_create_clientsession(
+                self.hass, trace_configs=[metrics.trace_config()]
+            )
             try:
-                self._async_abort_entries_match(
-                    {
-                        CONF_USERNAME: user_input[CONF_USERNAME],
-                    },
-                )
-                connection = AudiConnect(
-                    async_create_clientsession(self.hass),
+                connection = client.AudiConnect(
+                    session,
                     user_input[CONF_USERNAME],
                     user_input[CONF_PASSWORD],
                     user_input[CONF_COUNTRY],
                     user_input.get(CONF_PIN),
+                    api_unit_system(self.hass),
+                )
+                async with LoopBlockProbe() as probe:
+                    logged_in = await connection.async_login()
+                _LOGGER.debug(
+                    "Login blocked the event loop %.3fs (longest %.3fs)",
+                    probe.blocked,
+                    probe.max_block,
                 )
-                if await connection.async_login() is False:
-                    raise AuthorizationError(
+                if logged_in is False:
+                    raise client.AuthorizationError(
                         "Unexpected error communicating with the Audi server"
                     )
 
@@ -85,14 +115,22 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     if vehicle.support_vehicle is True
                 ]
                 if len(supported_vins) == 0:
-                    raise AudiException("Vehicles not supported")
+                    raise client.AudiException("Vehicles not supported")
 
-            except AuthorizationError:
+            except client.AuthorizationError:
                 errors["base"] = "invalid_auth"
-            except AudiException:
+            except client.AudiException:
                 errors["base"] = "cannot_connect"
+            except Exception:
+                await session.close()
+                raise
             else:
+                store_handover(
+                    self.hass, user_input[CONF_USERNAME], connection, metrics, session
+                )
                 return self.async_create_entry(title="Audi connect", data=user_input)
+            # No entry is created: the session of the failed attempt is dropped.
+            await session.close()
 
         return self.async_show_form(
             step_id="user", data_schema=DATA_SCHEMA, errors=errors
@@ -161,7 +199,65 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         selector.NumberSelectorConfig(
                             min=5, step=1, mode=selector.NumberSelectorMode.BOX
                         )
-                    )
+                    ),
+                    vol.Optional(
+                        CONF_MAX_STALENESS, default=DEFAULT_MAX_STALENESS
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            step=5,
+                            unit_of_measurement="min",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_STALL_WATCHDOG, default=False
+                    ): selector.BooleanSelector(),
+                    vol.Optional(
+                        CONF_STALL_THRESHOLD, default=DEFAULT_STALL_THRESHOLD
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=10,
+                            step=10,
+                            unit_of_measurement="ms",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_WAKEUP_HOURLY, default=DEFAULT_WAKEUP_HOURLY
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0, max=20, step=1, mode=selector.NumberSelectorMode.BOX
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_WAKEUP_DAILY, default=DEFAULT_WAKEUP_DAILY
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0, max=100, step=1, mode=selector.NumberSelectorMode.BOX
+                        )
+                    ),
+                    vol.Optional(CONF_PUSH_URL): selector.TextSelector(
+                        selector.TextSelectorConfig(type=selector.TextSelectorType.URL)
+                    ),
+                    vol.Optional(
+                        CONF_ZONE_EVENTS, default=False
+                    ): selector.BooleanSelector(),
+                    vol.Optional(
+                        CONF_METRICS_ENDPOINT, default=False
+                    ): selector.BooleanSelector(),
+                    vol.Optional(
+                        CONF_RECORD_TRAFFIC, default=False
+                    ): selector.BooleanSelector(),
+                    vol.Optional(
+                        CONF_DIAGNOSTICS_SECTIONS, default=DIAGNOSTICS_SECTIONS
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=DIAGNOSTICS_SECTIONS,
+                            multiple=True,
+                            translation_key=CONF_DIAGNOSTICS_SECTIONS,
+                        )
+                    ),
                 }
             ),
             self.config_entry.options,
@@ -1,6 +1,10 @@
 """Constants for the Audi connect integration."""
 
 DOMAIN = "audiconnect"
+DATA_HANDOVER = f"{DOMAIN}_handover"
+DATA_STARTUP_RAMP = f"{DOMAIN}_startup_ramp"
+DATA_METRICS_VIEW = f"{DOMAIN}_metrics_view"
+DATA_MEMORY_PROFILER = f"{DOMAIN}_memory_profiler"
 
 API_LEVEL_CLIMATISATION = "api_level_climatisation"
 API_LEVEL_VENTILATION = "api_level_ventilation"
@@ -11,6 +15,42 @@ CONF_COUNTRY = "region"
 CONF_VIN = "vin"
 CONF_ACTION = "action"
 CONF_VEHICLE = "vehicle"
+
+ACTION_LOCK = "lock"
+ACTION_UNLOCK = "unlock"
+ACTION_START_CLIMATISATION = "start_climatisation"
+ACTION_STOP_CLIMATISATION = "stop_climatisation"
+ACTION_START_CHARGER = "start_charger"
+ACTION_STOP_CHARGER = "stop_charger"
+ACTION_START_WINDOW_HEATING = "start_window_heating"
+ACTION_STOP_WINDOW_HEATING = "stop_window_heating"
+
+BINARY_SENSOR_TYPES = {
+    "doors_locked": {"name": "Doors locked", "icon": "mdi:car-door-lock"},
+    "windows_closed": {"name": "Windows closed", "icon": "mdi:car-door"},
+    "any_door_unlocked": {
+        "name": "Any door unlocked",
+        "icon": "mdi:car-door-lock-open",
+        "device_class": "lock",
+    },
+    "any_window_open": {
+        "name": "Any window open",
+        "icon": "mdi:car-door",
+        "device_class": "window",
+    },
+    "trunk_unlocked": {
+        "name": "Trunk unlocked",
+        "icon": "mdi:car-back",
+        "device_class": "lock",
+    },
+    "hood_open": {"name": "Hood open", "icon": "mdi:car", "device_class": "opening"},
+    "is_moving": {
+        "name": "Moving",
+        "icon": "mdi:car-arrow-right",
+        "device_class": "moving",
+    },
+}
+
 COUNTRY_CODE = {
     "AL": "Albania",
     "AM": "Armenia",
@@ -70,6 +110,71 @@ COUNTRY_CODE = {
 }
 CONF_SCAN_INTERVAL = "scan_interval"
 DEFAULT_SCAN_INTERVAL = 30
+CONF_STALL_WATCHDOG = "stall_watchdog"
+CONF_STALL_THRESHOLD = "stall_threshold"
+DEFAULT_STALL_THRESHOLD = 100
+CONF_PUSH_URL = "push_url"
+CONF_ZONE_EVENTS = "zone_events"
+EVENT_ZONE = f"{DOMAIN}_zone"
+CONF_DIAGNOSTICS_SECTIONS = "diagnostics_sections"
+DIAGNOSTICS_SECTIONS = [
+    "vehicle",
+    "position",
+    "users",
+    "charging",
+    "trips",
+    "climate",
+    "alerts",
+]
+# Keys redacted from the diagnostics and the traffic recordings.
+TO_REDACT = {
+    "address",
+    "api_key",
+    "city",
+    "country",
+    "csid",
+    "deviceId",
+    "email",
+    "encryption_password",
+    "encryption_salt",
+    "host",
+    "imei",
+    "ip4_addr",
+    "ip6_addr",
+    "lat",
+    "latitude",
+    "lng",
+    "lon",
+    "longitude",
+    "mappingVin",
+    "password",
+    "phone",
+    "pin",
+    "requestId",
+    "serial",
+    "system_serial",
+    "userId",
+    "username",
+    "vin",
+    "firstName",
+    "lastName",
+    "dateOfBirth",
+    "nickname",
+    "placeOfBirth",
+    "carnetEnrollmentCountry",
+    "spin",
+}
+REDACT_KEYS = frozenset(key.lower() for key in TO_REDACT)
+PUSH_RECONCILE_FACTOR = 4
+CONF_METRICS_ENDPOINT = "metrics_endpoint"
+CONF_RECORD_TRAFFIC = "record_traffic"
+CONF_WAKEUP_HOURLY = "wakeup_hourly"
+DEFAULT_WAKEUP_HOURLY = 2
+CONF_WAKEUP_DAILY = "wakeup_daily"
+DEFAULT_WAKEUP_DAILY = 10
+CONF_MAX_STALENESS = "max_staleness"
+DEFAULT_MAX_STALENESS = 60
+ATTR_DATA_AGE = "data_age"
 MANUFACTURER = "Audi"
 URL_WEBSITE = "https://my.audi.com"
 MENU_VEHICLES = "vehicles"
@@ -1,68 +1,813 @@
 """Audi connecgt coordinator."""
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import partial
+import importlib
 import logging
+from pathlib import Path
+import random
+import time
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+import zlib
 
-from audiconnectpy import AudiConnect, AudiException
-
+from aiohttp import ClientError
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_PIN, CONF_USERNAME
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.aiohttp_client import (
+    async_create_clientsession,
+    async_get_clientsession,
+)
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util.unit_system import US_CUSTOMARY_SYSTEM
 
-from .const import CONF_COUNTRY, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .cache import ResponseCache
+from .charging import ChargingTracker
+from .const import (
+    ATTR_DATA_AGE,
+    CONF_COUNTRY,
+    CONF_MAX_STALENESS,
+    CONF_PUSH_URL,
+    CONF_RECORD_TRAFFIC,
+    CONF_SCAN_INTERVAL,
+    CONF_STALL_THRESHOLD,
+    CONF_STALL_WATCHDOG,
+    CONF_WAKEUP_DAILY,
+    CONF_WAKEUP_HOURLY,
+    CONF_ZONE_EVENTS,
+    DATA_HANDOVER,
+    DATA_STARTUP_RAMP,
+    DEFAULT_MAX_STALENESS,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_STALL_THRESHOLD,
+    DEFAULT_WAKEUP_DAILY,
+    DEFAULT_WAKEUP_HOURLY,
+    DOMAIN,
+    PUSH_RECONCILE_FACTOR,
+)
+from .loop_monitor import LoopBlockProbe, StallWatchdog
+from .metrics import ApiMetrics, EndpointMetrics
+from .push import PushChannel, PushUpdate, WebSocketPushChannel
+from .traffic import TrafficRecorder
+from .view import VehicleMeta, VehicleView
+from .wakeup import PRIORITY_NORMAL, WakeUpScheduler
+from .zones import ZoneTracker, audi_fences
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+    from audiconnectpy import AudiConnect
 
 _LOGGER = logging.getLogger(__name__)
 
+CLIENT_MODULE = "audiconnectpy"
+HANDOVER_TTL = 300
+# Seconds between the first refreshes of entries set up together.
+STARTUP_RAMP_STEP = 3
+STARTUP_RAMP_MAX = 30
+# Random share of the interval added to each slot, capped in seconds.
+POLL_JITTER = 0.05
+POLL_JITTER_MAX = 30
+# A slot closer than this share of the interval is skipped.
+POLL_MIN_SPACING = 0.25
+# First retry after a failed refresh served from the last data, doubled
+# after each failure up to the polling interval.
+STALE_RETRY = 60
+# Timeouts (seconds) of the sub-fetches of a refresh.
+LOGIN_TIMEOUT = 60
+UPDATE_TIMEOUT = 120
+VEHICLE_TIMEOUT = 60
+FENCES_TIMEOUT = 20
+# Seconds between the updates of the whole account, which list the added
+# and removed vehicles; the refreshes in between update each vehicle.
+DISCOVERY_INTERVAL = 3600
+# A vehicle missing from the account is removed once it was missing from
+# this many complete refreshes, spread over at least this many seconds.
+RETIRE_REFRESHES = 3
+RETIRE_AFTER = 3600
+
+
+async def async_import_client(hass: HomeAssistant) -> ModuleType:
+    """Import the client library without blocking the event loop."""
+    return await hass.async_add_import_executor_job(
+        importlib.import_module, CLIENT_MODULE
+    )
+
+
+def _update_errors() -> tuple[type[Exception], ...]:
+    """Return the errors of a fetch that only fail that fetch.
+
+    Besides the client errors, transport errors and malformed responses
+    are caught, so they fail the vehicle or endpoint, not the refresh.
+    """
+    from audiconnectpy import AudiException
+
+    return (AudiException, ClientError, TimeoutError, KeyError, ValueError)
+
+
+def _describe(error: BaseException) -> str:
+    """Return the message of an error, or its type for a timeout."""
+    return str(error) or type(error).__name__
+
+
+def api_unit_system(hass: HomeAssistant) -> str:
+    """Return the unit system requested from the API."""
+    return "imperial" if hass.config.units is US_CUSTOMARY_SYSTEM else "metric"
+
+
+@dataclass
+class Handover:
+    """Connection validated by the config flow, reused by the first refresh."""
+
+    api: AudiConnect
+    metrics: ApiMetrics
+    session: ClientSession
+    created: float = field(default_factory=time.monotonic)
+
+    @property
+    def expired(self) -> bool:
+        """Return True once the connection is too old to be reused."""
+        return time.monotonic() - self.created > HANDOVER_TTL
+
+
+def close_handover(hass: HomeAssistant, handover: Handover) -> None:
+    """Close the session of a connection that will not be reused."""
+    hass.async_create_background_task(
+        handover.session.close(), f"{DOMAIN} close handover session"
+    )
+
+
+@callback
+def _async_expire_handovers(hass: HomeAssistant, _now: datetime | None = None) -> None:
+    """Close the validated connections no entry picked up in time."""
+    handovers = hass.data.get(DATA_HANDOVER, {})
+    for username, handover in list(handovers.items()):
+        if handover.expired:
+            _LOGGER.debug("Closing the unused connection validated for an entry")
+            close_handover(hass, handovers.pop(username))
+
+
+def store_handover(
+    hass: HomeAssistant,
+    username: str,
+    api: AudiConnect,
+    metrics: ApiMetrics,
+    session: ClientSession,
+) -> None:
+    """Keep a validated connection for the entry about to be created."""
+    _async_expire_handovers(hass)
+    handovers = hass.data.setdefault(DATA_HANDOVER, {})
+    if previous := handovers.pop(username, None):
+        close_handover(hass, previous)
+    handovers[username] = Handover(api, metrics, session)
+    async_call_later(hass, HANDOVER_TTL + 1, partial(_async_expire_handovers, hass))
+
+
+def pop_handover(hass: HomeAssistant, username: str) -> Handover | None:
+    """Return the connection validated for an account if still fresh."""
+    handover = hass.data.get(DATA_HANDOVER, {}).pop(username, None)
+    if handover is not None and handover.expired:
+        close_handover(hass, handover)
+        return None
+    return handover
+
 
 class AudiDataUpdateCoordinator(DataUpdateCoordinator):
     """Define an object to fetch datas."""
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Class to manage fetching Heatzy data API."""
-        unit_system = (
-            "imperial" if hass.config.units is US_CUSTOMARY_SYSTEM else "metric"
-        )
+        self.entry = entry
         self.options = entry.options
-        self.api = AudiConnect(
-            async_create_clientsession(hass),
-            entry.data[CONF_USERNAME],
-            entry.data[CONF_PASSWORD],
-            entry.data[CONF_COUNTRY],
-            entry.data.get(CONF_PIN),
-            unit_system,
+        self.metrics = ApiMetrics()
+        self.refreshes = EndpointMetrics()
+        self.cache = ResponseCache()
+        # Results read only for diagnostics, dropped shortly after a download.
+        self.diagnostics_cache = ResponseCache()
+        self._diagnostics_purge: Callable[[], None] | None = None
+        self.startup: dict[str, float] = {}
+        self.last_success: float | None = None
+        self.stale_error: str | None = None
+        self._stale_retries = 0
+        self.failures: dict[str, str] = {}
+        self._vehicle_success: dict[str, float] = {}
+        self.logins: deque[dict[str, float]] = deque(maxlen=10)
+        self.api: AudiConnect | None = None
+        self._seeded = False
+        self._entry_data = dict(entry.data)
+        self._platforms: list[
+            tuple[AddEntitiesCallback, Callable[[str], Iterable[Entity]]]
+        ] = []
+        self._vins: set[str] = set()
+        # Complete refreshes and first time each missing vehicle was missed.
+        self._complete = False
+        self._discovered: float | None = None
+        self._missing: dict[str, tuple[int, float]] = {}
+        self.watchdog: StallWatchdog | None = None
+        self.push: PushChannel | None = None
+        self.push_updates = 0
+        self.views: dict[str, VehicleView | None] = {}
+        self._meta: dict[str, VehicleMeta] = {}
+        self.zones: ZoneTracker | None = None
+        self.charging = ChargingTracker(hass, entry.entry_id)
+        self.recorder = TrafficRecorder(
+            Path(hass.config.path(DOMAIN, f"traffic_{entry.entry_id}.jsonl.gz")),
+            (entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD]),
         )
+        self._recording = False
+        self._recording_write: asyncio.Task | None = None
+        self.wakeups = WakeUpScheduler(
+            hass,
+            entry,
+            self.options.get(CONF_WAKEUP_HOURLY, DEFAULT_WAKEUP_HOURLY),
+            self.options.get(CONF_WAKEUP_DAILY, DEFAULT_WAKEUP_DAILY),
+            self.recorder.redaction.alias,
+        )
+        # Deterministic phase of the refresh slots of the account.
+        self._phase = zlib.crc32(entry.entry_id.encode()) % 1000 / 1000
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(
-                minutes=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+            update_interval=self._poll_interval(),
+        )
+        # Also stops the watchdog and the zone tracker after a failed setup.
+        entry.async_on_unload(self.async_shutdown)
+
+    async def _async_setup(self) -> None:
+        """Import the client library and create the API on first refresh.
+
+        Right after onboarding, the connection validated by the config flow
+        is reused so the first refresh needs no login and no update.
+        """
+        self._set_watchdog()
+        self._set_zones()
+        start = time.monotonic()
+        client = await async_import_client(self.hass)
+        self.startup["import_client"] = time.monotonic() - start
+        await self.charging.async_load()
+        await self.wakeups.async_load()
+        await self._async_set_push()
+        if handover := pop_handover(self.hass, self.entry.data[CONF_USERNAME]):
+            _LOGGER.debug("Reusing the connection validated by the config flow")
+            self.api = handover.api
+            self.metrics = handover.metrics
+            self._seeded = True
+            return
+        self.api = client.AudiConnect(
+            async_create_clientsession(
+                self.hass,
+                trace_configs=[
+                    self.metrics.trace_config(),
+                    self.recorder.trace_config(),
+                ],
             ),
+            self.entry.data[CONF_USERNAME],
+            self.entry.data[CONF_PASSWORD],
+            self.entry.data[CONF_COUNTRY],
+            self.entry.data.get(CONF_PIN),
+            api_unit_system(self.hass),
+        )
+        self._recording = True
+        self.recorder.active = bool(self.options.get(CONF_RECORD_TRAFFIC))
+        self.startup["ramp"] = ramp = self._startup_ramp()
+        if ramp:
+            # Only this entry waits, the entries are set up concurrently. A
+            # failed first refresh still raises ConfigEntryNotReady.
+            _LOGGER.debug("Delaying the first refresh by %.1fs", ramp)
+            await asyncio.sleep(ramp)
+
+    @callback
+    def async_add_vehicle_entities(
+        self,
+        async_add_entities: AddEntitiesCallback,
+        factory: Callable[[str], Iterable[Entity]],
+    ) -> None:
+        """Add the entities of each vehicle, now and when vehicles are added.
+
+        ``factory`` returns the entities of a platform for a VIN. Vehicles
+        added to the account later are set up with the stored callbacks and
+        the devices of removed vehicles are retired, without a reload.
+        """
+        if not self._platforms:
+            self._vins = set(self.data)
+            self.entry.async_on_unload(self.async_add_listener(self._async_fleet))
+        self._platforms.append((async_add_entities, factory))
+        async_add_entities([entity for vin in self.data for entity in factory(vin)])
+
+    @callback
+    def _async_fleet(self) -> None:
+        """Add and retire vehicles after a refresh.
+
+        Only complete refreshes count a vehicle as missing: a refresh served
+        from the last data, one that fell back to updating each vehicle, or
+        a push update never removes it.
+        """
+        complete, self._complete = self._complete, False
+        vins = set(self.data)
+        if added := vins - self._vins:
+            _LOGGER.debug("Vehicles added to the account: %s", len(added))
+            for async_add_entities, factory in self._platforms:
+                async_add_entities([entity for vin in added for entity in factory(vin)])
+        self._vins |= vins
+        for vin in vins:
+            self._missing.pop(vin, None)
+        if not complete:
+            return
+        now = time.monotonic()
+        removed = set()
+        for vin in self._vins - vins:
+            count, since = self._missing.get(vin, (0, now))
+            self._missing[vin] = (count + 1, since)
+            if count + 1 >= RETIRE_REFRESHES and now - since >= RETIRE_AFTER:
+                removed.add(vin)
+        if removed:
+            _LOGGER.debug("Vehicles removed from the account: %s", len(removed))
+            dev_reg = dr.async_get(self.hass)
+            for vin in removed:
+                self.cache.invalidate(vin)
+                self._meta.pop(vin, None)
+                self._vehicle_success.pop(vin, None)
+                if self.zones:
+                    self.zones.forget(vin)
+                if device := dev_reg.async_get_device(identifiers={(DOMAIN, vin)}):
+                    dev_reg.async_update_device(
+                        device.id, remove_config_entry_id=self.entry.entry_id
+                    )
+                self._missing.pop(vin)
+            self._vins -= removed
+
+    @callback
+    def async_expire_diagnostics(self, delay: float) -> None:
+        """Drop the results read for diagnostics once the delay has passed."""
+        if self._diagnostics_purge:
+            self._diagnostics_purge()
+        self._diagnostics_purge = async_call_later(
+            self.hass, delay, self._async_purge_diagnostics
+        )
+
+    @callback
+    def _async_purge_diagnostics(self, _now: datetime | None = None) -> None:
+        """Drop the results read for diagnostics."""
+        self._diagnostics_purge = None
+        self.diagnostics_cache.invalidate()
+
+    def vehicle_meta(self, vin: str) -> VehicleMeta:
+        """Return the metadata shared by the entities of a vehicle."""
+        if (meta := self._meta.get(vin)) is None:
+            meta = self._meta[vin] = VehicleMeta.from_vehicle(vin, self.data[vin])
+        return meta
+
+    def resolve_vin(self, target: str | None) -> str:
+        """Return the VIN of a vehicle given by VIN or device id."""
+        vehicles = self.api.vehicles if self.api else {}
+        if target in vehicles:
+            return target
+        if target and (device := dr.async_get(self.hass).async_get(target)):
+            for domain, vin in device.identifiers:
+                if domain == DOMAIN and vin in vehicles:
+                    return vin
+        raise HomeAssistantError(f"Unknown vehicle {target}")
+
+    def device_id(self, vin: str) -> str:
+        """Return the device id of a vehicle, its pseudonym without device."""
+        device = dr.async_get(self.hass).async_get_device(identifiers={(DOMAIN, vin)})
+        return device.id if device else self.recorder.redaction.alias(vin)
+
+    def charging_sessions(self, target: str | None, limit: int) -> dict[str, Any]:
+        """Return the latest charging sessions by device id."""
+        vin = None if target is None else self.resolve_vin(target)
+        return self.charging.sessions(vin, limit, self.device_id)
+
+    async def async_refresh_vehicle(
+        self, target: str | None, priority: str = PRIORITY_NORMAL
+    ) -> None:
+        """Wake a vehicle within its wake-up budget and refresh the data.
+
+        Clients without a wake-up request only refresh the vehicle, which
+        costs no wake-up.
+        """
+        vin = self.resolve_vin(target)
+        if wake := getattr(self.api.vehicles[vin], "async_wakeup", None):
+            await self.wakeups.async_wake(vin, wake, priority)
+        self.cache.invalidate(vin)
+        await self.async_request_refresh()
+
+    async def async_apply_options(self, entry: ConfigEntry) -> bool:
+        """Apply changed options to the running coordinator.
+
+        Return False when credentials or region changed and the entry must
+        be reloaded.
+        """
+        if dict(entry.data) != self._entry_data:
+            return False
+        if entry.options.get(CONF_RECORD_TRAFFIC) and not self._recording:
+            # The session reused from the config flow has no recorder.
+            return False
+        start = time.monotonic()
+        previous = self._poll_interval()
+        self.options = entry.options
+        self._set_api_level()
+        self._set_watchdog()
+        self._set_zones()
+        self.wakeups.hourly = self.options.get(
+            CONF_WAKEUP_HOURLY, DEFAULT_WAKEUP_HOURLY
+        )
+        self.wakeups.daily = self.options.get(CONF_WAKEUP_DAILY, DEFAULT_WAKEUP_DAILY)
+        self.recorder.active = bool(self.options.get(CONF_RECORD_TRAFFIC))
+        await self._async_set_push()
+        self.update_interval = self._next_interval()
+        entities = er.async_entries_for_config_entry(
+            er.async_get(self.hass), entry.entry_id
+        )
+        _LOGGER.debug(
+            "Options applied in %.1f ms without reload, saving a login, "
+            "a full update and the setup of %s entities",
+            (time.monotonic() - start) * 1000,
+            len(entities),
+        )
+        if self._poll_interval() < previous:
+            await self.async_request_refresh()
+        return True
+
+    async def async_attach_push(self, channel: PushChannel | None) -> None:
+        """Replace the push channel merging partial states into the data."""
+        if self.push:
+            await self.push.async_stop()
+        self.push = channel
+        if channel:
+            await channel.async_start(
+                self._async_handle_push, self._async_push_connection
+            )
+
+    async def _async_set_push(self) -> None:
+        """Attach or detach the websocket push channel from the options."""
+        url = self.options.get(CONF_PUSH_URL)
+        if url == getattr(self.push, "url", None):
+            return
+        await self.async_attach_push(
+            WebSocketPushChannel(
+                self.hass, self.entry, async_get_clientsession(self.hass), url
+            )
+            if url
+            else None
+        )
+
+    @callback
+    def _async_push_connection(self, connected: bool) -> None:
+        """Reschedule the polling when the push channel connects or drops."""
+        _LOGGER.debug("Push channel %s", "connected" if connected else "lost")
+        self.update_interval = self._next_interval()
+        # Before the first refresh the interval is applied once it completes.
+        if self._listeners:
+            self._schedule_refresh()
+
+    @callback
+    def _async_handle_push(self, update: PushUpdate) -> None:
+        """Merge a partial state pushed for a vehicle."""
+        if not self.data or (vehicle := self.data.get(update.vin)) is None:
+            return
+        vehicle.states.update(update.states)
+        if update.state and isinstance(getattr(vehicle, "state", None), dict):
+            vehicle.state.update(update.state)
+        view = self.views[update.vin] = VehicleView.from_vehicle(vehicle)
+        if self.zones and view:
+            self.zones.async_evaluate(update.vin, view.latitude, view.longitude)
+        self.charging.update(update.vin, vehicle.states)
+        self.push_updates += 1
+        self.async_update_listeners()
+
+    def _startup_ramp(self) -> float:
+        """Reserve a startup slot and return the delay until it."""
+        now = time.monotonic()
+        slot = max(now, self.hass.data.get(DATA_STARTUP_RAMP, now))
+        if slot - now > STARTUP_RAMP_MAX:
+            slot = now
+        self.hass.data[DATA_STARTUP_RAMP] = slot + STARTUP_RAMP_STEP
+        return slot - now
+
+    def _next_interval(self) -> timedelta:
+        """Return the delay to the next refresh slot of the entry, jittered.
+
+        Slots are spaced by the polling interval and shifted by the phase
+        of the entry, so the accounts do not all refresh at the same time.
+        """
+        interval = self._poll_interval().total_seconds()
+        delay = interval - (time.time() - self._phase * interval) % interval
+        if delay < interval * POLL_MIN_SPACING:
+            delay += interval
+        jitter = min(interval * POLL_JITTER, POLL_JITTER_MAX)
+        return timedelta(seconds=delay + random.uniform(-jitter, jitter))
+
+    def _retry_interval(self) -> timedelta:
+        """Return the backed off delay to the next retry of a failed refresh."""
+        interval = self._poll_interval()
+        retry = timedelta(seconds=STALE_RETRY * 2 ** (self._stale_retries - 1))
+        return min(retry, interval)
+
+    def _max_staleness(self) -> timedelta:
+        """Return how long the last data is served after failed refreshes."""
+        return timedelta(
+            minutes=self.options.get(CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS)
+        )
+
+    def data_age(self, vin: str | None = None) -> int | None:
+        """Return the age in seconds of the data served while refreshes fail.
+
+        With a VIN, also while the updates of that vehicle alone fail.
+        """
+        if self.stale_error is None and vin not in self.failures:
+            return None
+        since = self._vehicle_success.get(vin, self.last_success)
+        return None if since is None else round(time.time() - since)
+
+    def vehicle_available(self, vin: str) -> bool:
+        """Return False once the failing updates of a vehicle exceed the limit.
+
+        A vehicle missing from the account is unavailable until removed.
+        """
+        if self.data is not None and vin not in self.data:
+            return False
+        if vin not in self.failures or (age := self.data_age(vin)) is None:
+            return True
+        return age <= self._max_staleness().total_seconds()
+
+    def stale_attributes(self, vin: str, attributes: dict | None) -> dict | None:
+        """Add the data age to the attributes of an entity while stale."""
+        if (age := self.data_age(vin)) is None:
+            return attributes
+        return {**(attributes or {}), ATTR_DATA_AGE: age}
+
+    def _poll_interval(self) -> timedelta:
+        """Return the polling interval, slower while push is healthy."""
+        interval = timedelta(
+            minutes=self.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
+        if self.push and self.push.connected:
+            return interval * PUSH_RECONCILE_FACTOR
+        return interval
+
+    def _set_watchdog(self) -> None:
+        """Start, restart or stop the stall watchdog from the options."""
+        threshold = (
+            self.options.get(CONF_STALL_THRESHOLD, DEFAULT_STALL_THRESHOLD) / 1000
         )
+        if self.watchdog and (
+            not self.options.get(CONF_STALL_WATCHDOG)
+            or self.watchdog.threshold != threshold
+        ):
+            self.watchdog.stop()
+            self.watchdog = None
+        if self.options.get(CONF_STALL_WATCHDOG) and self.watchdog is None:
+            self.watchdog = StallWatchdog(threshold)
+
+    def _set_zones(self) -> None:
+        """Start or stop the zone tracker from the options."""
+        if self.options.get(CONF_ZONE_EVENTS) and self.zones is None:
+            self.zones = ZoneTracker(self.hass, self.device_id)
+        elif not self.options.get(CONF_ZONE_EVENTS) and self.zones:
+            self.zones.stop()
+            self.zones = None
+
+    async def _async_update_zones(self, data: dict, failures: dict[str, str]) -> None:
+        """Refresh the Audi fences and evaluate the vehicle positions."""
+        errors = _update_errors()
+
+        for vin, vehicle in data.items():
+            try:
+                async with asyncio.timeout(FENCES_TIMEOUT):
+                    fences = await self.cache.async_get(
+                        vin, "fences", vehicle.async_get_fences
+                    )
+            except errors as error:
+                _LOGGER.debug(
+                    "Unable to read the fences of %s: %s",
+                    self.recorder.redaction.alias(vin),
+                    error,
+                )
+                failures[f"{vin}.fences"] = _describe(error)
+            else:
+                self.zones.set_fences(vin, audi_fences(self.device_id(vin), fences))
+            if view := self.views.get(vin):
+                self.zones.async_evaluate(vin, view.latitude, view.longitude)
+
+    async def async_shutdown(self) -> None:
+        """Stop the background work and the coordinator, flush the recording."""
+        if self.watchdog:
+            self.watchdog.stop()
+            self.watchdog = None
+        if self.zones:
+            self.zones.stop()
+            self.zones = None
+        if self.push:
+            await self.push.async_stop()
+        if self._diagnostics_purge:
+            self._diagnostics_purge()
+        self._async_purge_diagnostics()
+        self._async_write_recording()
+        if self._recording_write:
+            await self._recording_write
+        await super().async_shutdown()
+
+    @callback
+    def _async_write_recording(self) -> None:
+        """Append the recorded exchanges once the previous write is done."""
+        if records := self.recorder.take():
+            self._recording_write = self.entry.async_create_background_task(
+                self.hass,
+                self._async_append_recording(self._recording_write, records),
+                f"{DOMAIN} traffic recording",
+            )
+
+    async def _async_append_recording(
+        self, previous: asyncio.Task | None, records: list[dict[str, Any]]
+    ) -> None:
+        """Append exchanges to the recording, in order."""
+        if previous:
+            await asyncio.wait([previous])
+        try:
+            await self.hass.async_add_executor_job(self.recorder.write, records)
+        except OSError as error:
+            _LOGGER.warning("Unable to write the traffic recording: %s", error)
 
     async def _async_update_data(self) -> dict:
-        """Update data."""
+        """Update data and schedule the next refresh slot.
+
+        A failed refresh keeps serving the last data, retried with backoff,
+        until it is older than the staleness limit. Entities stay available
+        and unchanged meanwhile.
+        """
+        start = time.monotonic()
+        error: str | None = None
         try:
-            await self.api.async_update()
+            if self.watchdog is None:
+                data = await self._async_update()
+            else:
+                data = await self.watchdog.async_run(
+                    "coordinator_update", self._async_update()
+                )
+        except (UpdateFailed, TimeoutError) as err:
+            error = type(err.__cause__ or err).__name__
+            if not self._serve_stale(err):
+                raise
+            return self.data
+        except Exception as err:
+            error = type(err.__cause__ or err).__name__
+            raise
+        else:
+            if self.stale_error:
+                _LOGGER.info(
+                    "Refresh recovered after %s failed attempts", self._stale_retries
+                )
+            self.last_success = time.time()
+            self.stale_error = None
+            self._stale_retries = 0
+            return data
+        finally:
+            self.refreshes.record(time.monotonic() - start, error)
+            self._async_write_recording()
+            self.update_interval = (
+                self._retry_interval() if self.stale_error else self._next_interval()
+            )
+
+    def _serve_stale(self, err: Exception) -> bool:
+        """Return True to keep the last data after a failed refresh."""
+        if self.data is None or self.last_success is None:
+            return False
+        age = time.time() - self.last_success
+        if age > self._max_staleness().total_seconds():
+            _LOGGER.warning(
+                "Data is %s minutes old, marking the entities unavailable",
+                round(age / 60),
+            )
+            self.stale_error = None
+            self._stale_retries = 0
+            return False
+        if self.stale_error is None:
+            _LOGGER.warning("Refresh failed, keeping the last data: %s", err)
+        else:
+            _LOGGER.debug("Refresh failed again, keeping the last data: %s", err)
+        self.stale_error = str(err) or type(err).__name__
+        self._stale_retries += 1
+        return True
+
+    async def _async_update(self) -> dict:
+        """Login if needed and update the vehicles.
+
+        The known vehicles are updated each on its own, within its own
+        timeout, so one stuck vehicle does not fail the whole refresh: it
+        keeps its last data and is listed in ``failures``. The account is
+        updated as a whole, listing added and removed vehicles, on the
+        first refresh and then every ``DISCOVERY_INTERVAL``; when that
+        fails, its refresh falls back to updating each vehicle.
+        """
+        errors = _update_errors()
+        failures: dict[str, str] = {}
+        self._complete = False
+        account = (
+            not self.data
+            or self._discovered is None
+            or time.monotonic() - self._discovered >= DISCOVERY_INTERVAL
+        )
+        account_error: BaseException | None = None
+        try:
+            if not self._seeded:
+                if not self.api.is_connected:
+                    async with asyncio.timeout(LOGIN_TIMEOUT):
+                        await self._async_login()
+                if account:
+                    async with asyncio.timeout(UPDATE_TIMEOUT):
+                        await self.api.async_update()
+            if account:
+                self._discovered = time.monotonic()
+            self._seeded = False
             if not self.api.is_connected:
                 raise UpdateFailed("Unable to connect")
-            self._set_api_level()
-        except AudiException as error:
-            raise UpdateFailed(error) from error
-        else:
-            return {
-                vin: vehicle
-                for vin, vehicle in self.api.vehicles.items()
-                if vehicle.support_vehicle is True
-            }
+        except errors as error:
+            if not self.data or not self.api.is_connected:
+                raise UpdateFailed(_describe(error)) from error
+            _LOGGER.debug("Account update failed, updating each vehicle: %s", error)
+            account, account_error = False, error
+        if not account:
+            failures = await self._async_update_vehicles(self.data)
+            if len(failures) == len(self.data):
+                raise UpdateFailed(
+                    _describe(account_error)
+                    if account_error
+                    else next(iter(failures.values()))
+                ) from account_error
+        self._set_api_level()
+        data = {
+            vin: vehicle
+            for vin, vehicle in self.api.vehicles.items()
+            if vehicle.support_vehicle is True
+        }
+        now = time.time()
+        views = {}
+        for vin, vehicle in data.items():
+            if vin in failures and vin in self.views:
+                views[vin] = self.views[vin]
+                continue
+            views[vin] = VehicleView.from_vehicle(vehicle)
+            self._vehicle_success[vin] = now
+            self.charging.update(vin, vehicle.states)
+        self.views = views
+        if self.zones:
+            await self._async_update_zones(data, failures)
+        if failures:
+            _LOGGER.debug("Refresh completed with %s failed fetches", len(failures))
+        self.failures = failures
+        self._complete = account
+        return data
+
+    async def _async_update_vehicles(self, vehicles: dict) -> dict[str, str]:
+        """Update each vehicle on its own and return the failures by VIN."""
+        errors = _update_errors()
+
+        async def _async_update_vehicle(vin: str, vehicle) -> tuple[str, str | None]:
+            try:
+                async with asyncio.timeout(VEHICLE_TIMEOUT):
+                    await vehicle.async_update()
+            except errors as error:
+                return vin, _describe(error)
+            return vin, None
+
+        results = await asyncio.gather(
+            *(_async_update_vehicle(vin, vehicle) for vin, vehicle in vehicles.items())
+        )
+        return {vin: error for vin, error in results if error}
+
+    async def _async_login(self) -> None:
+        """Login and measure how long it holds the event loop."""
+        start = time.monotonic()
+        async with LoopBlockProbe() as probe:
+            await self.api.async_login()
+        login = {
+            "duration": round(time.monotonic() - start, 3),
+            "loop_blocked": round(probe.blocked, 3),
+            "max_block": round(probe.max_block, 3),
+        }
+        self.logins.append(login)
+        _LOGGER.debug(
+            "Login took %ss, event loop blocked %ss (longest %ss)",
+            login["duration"],
+            login["loop_blocked"],
+            login["max_block"],
+        )
 
     def _set_api_level(self) -> None:
         """Set API Level."""
-        if isinstance(self.api.vehicles, dict):
+        if self.api and isinstance(self.api.vehicles, dict):
             for vin, Vehicle in self.api.vehicles.items():
                 if api_levels := self.options.get(vin):
                     for name, level in api_levels.items():
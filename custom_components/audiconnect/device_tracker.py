@@ -11,6 +11,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .loop_monitor import watched
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,21 +22,19 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the device tracker platform."""
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
-    connection = hass.data[DOMAIN][config_entry.entry_id]["connection"]
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    connection = coordinator.api
 
-    entities = []
-    
-    for vehicle in coordinator.data or []:
-        entities.append(
+    def vehicle_entities(vin: str) -> list[AudiConnectDeviceTracker]:
+        return [
             AudiConnectDeviceTracker(
                 coordinator,
                 connection,
-                vehicle,
+                coordinator.data[vin],
             )
-        )
+        ]
 
-    async_add_entities(entities)
+    coordinator.async_add_vehicle_entities(async_add_entities, vehicle_entities)
 
 
 class AudiConnectDeviceTracker(CoordinatorEntity, TrackerEntity):
@@ -52,80 +51,45 @@ class AudiConnectDeviceTracker(CoordinatorEntity, TrackerEntity):
         self._connection = connection
         self._vehicle = vehicle
         self._attr_unique_id = f"{vehicle.vin}_tracker"
+        self._attr_device_info = coordinator.vehicle_meta(vehicle.vin).device_info
         self._attr_name = f"{vehicle.title} Location"
         self._attr_icon = "mdi:car"
 
     @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._vehicle.vin)},
-            "name": self._vehicle.title,
-            "manufacturer": "Audi",
-            "model": self._vehicle.model,
-            "sw_version": self._vehicle.model_year,
-        }
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return (
+            super().available
+            and self.coordinator.vehicle_available(self._vehicle.vin)
+        )
 
     @property
     def latitude(self) -> float | None:
         """Return latitude value of the device."""
-        if not self._vehicle or not self._vehicle.state:
+        if (view := self.coordinator.views.get(self._vehicle.vin)) is None:
             return None
-        
-        position = self._vehicle.state.get("position")
-        if position and "lat" in position:
-            try:
-                return float(position["lat"])
-            except (ValueError, TypeError):
-                return None
-        return None
+        return view.latitude
 
     @property
     def longitude(self) -> float | None:
         """Return longitude value of the device."""
-        if not self._vehicle or not self._vehicle.state:
+        if (view := self.coordinator.views.get(self._vehicle.vin)) is None:
             return None
-        
-        position = self._vehicle.state.get("position")
-        if position and "lng" in position:
-            try:
-                return float(position["lng"])
-            except (ValueError, TypeError):
-                return None
-        return None
+        return view.longitude
 
     @property
     def location_accuracy(self) -> int:
         """Return the location accuracy of the device."""
         return 100  # Meters
 
-    @property
+    @watched
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional state attributes."""
-        if not self._vehicle or not self._vehicle.state:
+        if (view := self.coordinator.views.get(self._vehicle.vin)) is None:
             return None
-            
-        attributes = {}
-        vehicle_state = self._vehicle.state
-        
-        # Add parking information if available
-        if "parkingPosition" in vehicle_state:
-            parking_pos = vehicle_state["parkingPosition"]
-            if parking_pos:
-                attributes["parking_time"] = parking_pos.get("parkingTime")
-                
-        # Add movement status
-        attributes["is_moving"] = vehicle_state.get("isMoving", False)
-        
-        # Add last update time
-        if hasattr(self._vehicle, 'last_update_time'):
-            attributes["last_update"] = self._vehicle.last_update_time
-            
-        # Add VIN (last 4 digits only for privacy)
-        if self._vehicle.vin:
-            attributes["vin"] = f"***{self._vehicle.vin[-4:]}"
-            
-        return attributes if attributes else None
+        return self.coordinator.stale_attributes(
+            self._vehicle.vin, view.attributes["tracker"] or None
+        )
 
     @property
     def source_type(self) -> str:
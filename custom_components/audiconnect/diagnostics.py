@@ -1,107 +1,274 @@
 """Diagnostics support for Audi Connect."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Mapping
 from contextlib import suppress
+from dataclasses import asdict, fields, is_dataclass
+from enum import Enum
 from typing import Any
 
-from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntry
 
-from .const import DOMAIN
-
-TO_REDACT = {
-    "address",
-    "api_key",
-    "city",
-    "country",
-    "csid",
-    "deviceId",
-    "email",
-    "encryption_password",
-    "encryption_salt",
-    "host",
-    "imei",
-    "ip4_addr",
-    "ip6_addr",
-    "lat",
-    "latitude",
-    "lon",
-    "longitude",
-    "mappingVin",
-    "password",
-    "phone",
-    "pin",
-    "requestId",
-    "serial",
-    "system_serial",
-    "userId",
-    "username",
-    "vin",
-    "firstName",
-    "lastName",
-    "dateOfBirth",
-    "nickname",
-    "placeOfBirth",
-    "carnetEnrollmentCountry",
-    "spin",
+from .cache import CACHE_TTL
+from .const import (
+    CONF_DIAGNOSTICS_SECTIONS,
+    DIAGNOSTICS_SECTIONS,
+    DOMAIN,
+    REDACT_KEYS,
+    TO_REDACT,
+)
+
+# Approximate JSON size (bytes) allowed per section and per download.
+SECTION_LIMIT = 256 * 1024
+TOTAL_LIMIT = 4 * 1024 * 1024
+STRING_LIMIT = 4096
+MAX_DEPTH = 12
+TRUNCATED = "**TRUNCATED**"
+
+# Endpoint results are reused for repeated downloads within this delay,
+# then dropped. Endpoints with a time to live use the response cache.
+DIAGNOSTICS_TTL = 120
+
+# Endpoints (with their arguments) read for each diagnostics section.
+SECTION_ENDPOINTS: dict[str, tuple[tuple[str, ...], ...]] = {
+    "vehicle": (
+        ("vehicle_details",),
+        ("vehicle",),
+        ("capabilities",),
+        ("operations_list",),
+        ("real_car_data",),
+        ("mbb_status",),
+        ("identity_data",),
+    ),
+    "position": (("stored_position",), ("destinations",), ("history",)),
+    "users": (("vehicule_users",), ("users",)),
+    "charging": (("charger",),),
+    "trips": (
+        ("tripdata", "cyclic"),
+        ("tripdata", "longTerm"),
+        ("tripdata", "shortTerm"),
+    ),
+    "climate": (("climater",), ("preheater",), ("climater_timer",)),
+    "alerts": (
+        ("honkflash",),
+        ("fences",),
+        ("fences_config",),
+        ("speed_alert",),
+        ("speed_config",),
+    ),
 }
 
 
+def _attributes(value: Any) -> dict[str, Any] | None:
+    """Return the public attributes of an object, None when it has none."""
+    if isinstance(value, type) or callable(value):
+        return None
+    if is_dataclass(value):
+        names = [field.name for field in fields(value)]
+    elif hasattr(value, "__dict__"):
+        names = list(vars(value))
+    else:
+        names = []
+        for cls in type(value).__mro__:
+            slots = getattr(cls, "__slots__", ())
+            names.extend((slots,) if isinstance(slots, str) else slots)
+    if not names:
+        return None
+    return {
+        name: getattr(value, name)
+        for name in names
+        if not name.startswith("_") and hasattr(value, name)
+    }
+
+
+class Redactor:
+    """Redact and size-cap diagnostics sections in a single pass.
+
+    Each section is copied while it is walked, so the raw endpoint results
+    can be dropped as soon as they are redacted and the download never
+    holds more than the configured budget.
+    """
+
+    def __init__(
+        self, section_limit: int = SECTION_LIMIT, total_limit: int = TOTAL_LIMIT
+    ) -> None:
+        """Initialize the redactor."""
+        self.section_limit = section_limit
+        self.remaining = total_limit
+        self.truncated: list[str] = []
+        self._budget = 0
+        self._cut = False
+        self._seen: set[int] = set()
+
+    def section(self, name: str, value: Any) -> Any:
+        """Return a redacted copy of a section within the budget."""
+        if self.remaining <= 0:
+            self.truncated.append(name)
+            return TRUNCATED
+        limit = min(self.section_limit, self.remaining)
+        self._budget, self._cut = limit, False
+        self._seen: set[int] = set()
+        result = self._walk(value, 0)
+        self.remaining -= limit - self._budget
+        if self._cut:
+            self.truncated.append(name)
+        return result
+
+    def _walk(self, value: Any, depth: int) -> Any:
+        """Copy a value, redacting keys and truncating past the budget."""
+        if value is None or isinstance(value, bool | int | float):
+            self._budget -= 8
+            return value
+        if isinstance(value, str):
+            keep = min(len(value), STRING_LIMIT, max(self._budget, 64))
+            self._budget -= keep + 2
+            if keep < len(value):
+                self._cut = True
+                return value[:keep] + TRUNCATED
+            return value
+        if depth >= MAX_DEPTH:
+            self._cut = True
+            return TRUNCATED
+        if isinstance(value, Enum):
+            return self._walk(value.value, depth)
+        if not isinstance(value, Mapping | list | tuple | set):
+            # Client objects are walked as mappings so their keys get redacted.
+            if id(value) in self._seen or (attributes := _attributes(value)) is None:
+                return self._walk(repr(value), depth)
+            self._seen.add(id(value))
+            value = attributes
+        if isinstance(value, Mapping):
+            result = {}
+            for key, item in value.items():
+                if self._budget <= 0:
+                    self._cut = True
+                    result[TRUNCATED] = f"{len(value) - len(result)} keys omitted"
+                    break
+                self._budget -= len(str(key)) + 4
+                result[key] = (
+                    REDACTED
+                    if str(key).lower() in REDACT_KEYS
+                    else self._walk(item, depth + 1)
+                )
+            return result
+        items = []
+        for item in value:
+            if self._budget <= 0:
+                self._cut = True
+                items.append(f"{TRUNCATED} {len(value) - len(items)} items omitted")
+                break
+            items.append(self._walk(item, depth + 1))
+        return items
+
+
+async def _async_vehicle_diagnostics(
+    coordinator: Any, redactor: Redactor, label: str, vehicle: Any
+) -> Any:
+    """Return the redacted attributes and endpoint results of a vehicle."""
+    data = redactor.section(label, vehicle)
+    if not isinstance(data, dict):
+        return data
+    sections = coordinator.options.get(CONF_DIAGNOSTICS_SECTIONS, DIAGNOSTICS_SECTIONS)
+    for section in sections:
+        for endpoint, *args in SECTION_ENDPOINTS.get(section, ()):
+            name = "_".join((endpoint, *args))
+            rslt = {}
+            # Nothing more fits in the download: spare the cloud request.
+            if redactor.remaining > 0:
+                cache = (
+                    coordinator.cache
+                    if endpoint in CACHE_TTL
+                    else coordinator.diagnostics_cache
+                )
+                with suppress(Exception):
+                    rsp = await cache.async_get(
+                        vehicle.vin,
+                        endpoint,
+                        getattr(vehicle, f"async_get_{endpoint}"),
+                        *args,
+                        min_ttl=DIAGNOSTICS_TTL,
+                    )
+                    rslt = (
+                        rsp
+                        if isinstance(
+                            rsp, dict | list | set | float | int | str | tuple
+                        )
+                        else vars(rsp)
+                    )
+            data[name] = redactor.section(f"{label}.{name}", rslt)
+    data["refresh_failures"] = {
+        key.partition(".")[2] or "update": error
+        for key, error in coordinator.failures.items()
+        if key.partition(".")[0] == vehicle.vin
+    }
+    data["data_age"] = coordinator.data_age(vehicle.vin)
+    return data
+
+
+def _coordinator_diagnostics(coordinator: Any, entry: ConfigEntry) -> dict[str, Any]:
+    """Return the diagnostics of the connection shared by the vehicles."""
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": async_redact_data(entry.options, TO_REDACT),
+        },
+        "metrics": coordinator.metrics.as_dict(),
+        "cache": coordinator.cache.as_dict(),
+        "startup": coordinator.startup,
+        "logins": list(coordinator.logins),
+        "stale": {
+            "error": coordinator.stale_error,
+            "data_age": coordinator.data_age(),
+        },
+        "push": {
+            "connected": coordinator.push.connected,
+            "updates": coordinator.push_updates,
+        }
+        if coordinator.push
+        else None,
+        "stalls": [asdict(record) for record in coordinator.watchdog.records]
+        if coordinator.watchdog
+        else None,
+    }
+
+
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
+    redactor = Redactor()
     _datas = {}
+    for i, vehicle in enumerate(coordinator.data.values(), 1):
+        _datas[i] = await _async_vehicle_diagnostics(
+            coordinator, redactor, str(i), vehicle
+        )
+    coordinator.async_expire_diagnostics(DIAGNOSTICS_TTL)
+    return {
+        **_coordinator_diagnostics(coordinator, entry),
+        "data": _datas,
+        "truncated": redactor.truncated,
+    }
 
-    async def diag(func: Callable[..., Any], *args: Any) -> None:
-        rslt = {}
-        with suppress(Exception):
-            rsp = await func(*args)
-            rslt = (
-                rsp
-                if isinstance(rsp, dict | list | set | float | int | str | tuple)
-                else vars(rsp)
-            )
-
-        _datas[i].update({func.__name__.replace("async_get_", ""): rslt})
-
-    i = 0
-    for vehicle in coordinator.data.values():
-        i += 1
-        _datas.update({i: vars(vehicle)})
-        await diag(vehicle.async_get_vehicle_details)
-        await diag(vehicle.async_get_vehicle)
-        await diag(vehicle.async_get_stored_position)
-        await diag(vehicle.async_get_destinations)
-        await diag(vehicle.async_get_history)
-        await diag(vehicle.async_get_vehicule_users)
-        await diag(vehicle.async_get_charger)
-        await diag(vehicle.async_get_tripdata, "cyclic")
-        await diag(vehicle.async_get_tripdata, "longTerm")
-        await diag(vehicle.async_get_tripdata, "shortTerm")
-        await diag(vehicle.async_get_operations_list)
-        await diag(vehicle.async_get_climater)
-        await diag(vehicle.async_get_preheater)
-        await diag(vehicle.async_get_climater_timer)
-        await diag(vehicle.async_get_capabilities)
-        await diag(vehicle.async_get_honkflash)
-        # await diag(vehicle.async_get_personal_data)
-        await diag(vehicle.async_get_real_car_data)
-        await diag(vehicle.async_get_mbb_status)
-        await diag(vehicle.async_get_identity_data)
-        await diag(vehicle.async_get_users)
-        await diag(vehicle.async_get_fences)
-        await diag(vehicle.async_get_fences_config)
-        await diag(vehicle.async_get_speed_alert)
-        await diag(vehicle.async_get_speed_config)
 
+async def async_get_device_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry, device: DeviceEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a vehicle."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    redactor = Redactor()
+    _datas = {}
+    for domain, vin in device.identifiers:
+        if domain == DOMAIN and (vehicle := coordinator.data.get(vin)) is not None:
+            _datas[1] = await _async_vehicle_diagnostics(
+                coordinator, redactor, "1", vehicle
+            )
+    coordinator.async_expire_diagnostics(DIAGNOSTICS_TTL)
     return {
-        "entry": {
-            "data": async_redact_data(entry.data, TO_REDACT),
-            "options": async_redact_data(entry.options, TO_REDACT),
-        },
-        "data": async_redact_data(_datas, TO_REDACT),
+        **_coordinator_diagnostics(coordinator, entry),
+        "data": _datas,
+        "truncated": redactor.truncated,
     }
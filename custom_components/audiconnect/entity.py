@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, URL_WEBSITE
 from .coordinator import AudiDataUpdateCoordinator
 from .helpers import (
     AudiBinarySensorDescription,
@@ -21,11 +22,39 @@ from .helpers import (
 _LOGGER = logging.getLogger(__name__)
 
 
-class AudiEntity(CoordinatorEntity[AudiDataUpdateCoordinator], Entity):
-    """Base class for all entities."""
+class AudiVehicleEntity(CoordinatorEntity[AudiDataUpdateCoordinator], Entity):
+    """Base class for the entities of a vehicle."""
 
     _attr_has_entity_name = True
 
+    def __init__(self, coordinator: AudiDataUpdateCoordinator, vin: str) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self.vin = vin
+        self._attr_device_info = coordinator.vehicle_meta(vin).device_info
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the vehicle attributes, with the data age while stale."""
+        return self.coordinator.stale_attributes(
+            self.vin, self._attr_extra_state_attributes
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return if the data of the vehicle is not too old."""
+        return super().available and self.coordinator.vehicle_available(self.vin)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data, unless the vehicle left the account."""
+        if self.vin in self.coordinator.data:
+            super()._handle_coordinator_update()
+
+
+class AudiEntity(AudiVehicleEntity):
+    """Base class for the entities of a vehicle state."""
+
     def __init__(
         self,
         coordinator: AudiDataUpdateCoordinator,
@@ -39,25 +68,11 @@ class AudiEntity(CoordinatorEntity[AudiDataUpdateCoordinator], Entity):
         | AudiTrackerDescription,
     ) -> None:
         """Initialize the entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, vin)
         vehicle = coordinator.data[vin]
         self.entity = vehicle.states[description.key]
-        self.vin = vin
         self.uid = description.key
         self._attr_unique_id = f"{vin}_{description.key}"
         self._attr_name = description.key.capitalize().replace("_", " ")
         self.entity_description = description
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, vin)},
-            "manufacturer": MANUFACTURER,
-            "name": vehicle.title,
-            "model": vehicle.model,
-            "configuration_url": URL_WEBSITE,
-        }
-        self._attr_extra_state_attributes = {
-            "model": vehicle.model,
-            "model_year": vehicle.model_year,
-            "title": vehicle.title,
-            "csid": vehicle.csid,
-            "vin": vin,
-        }
+        self._attr_extra_state_attributes = coordinator.vehicle_meta(vin).attributes
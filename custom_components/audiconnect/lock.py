@@ -12,6 +12,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, ACTION_LOCK, ACTION_UNLOCK
+from .loop_monitor import watched
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,21 +23,19 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the lock platform."""
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
-    connection = hass.data[DOMAIN][config_entry.entry_id]["connection"]
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    connection = coordinator.api
 
-    entities = []
-    
-    for vehicle in coordinator.data or []:
-        entities.append(
+    def vehicle_entities(vin: str) -> list[AudiConnectLock]:
+        return [
             AudiConnectLock(
                 coordinator,
                 connection,
-                vehicle,
+                coordinator.data[vin],
             )
-        )
+        ]
 
-    async_add_entities(entities)
+    coordinator.async_add_vehicle_entities(async_add_entities, vehicle_entities)
 
 
 class AudiConnectLock(CoordinatorEntity, LockEntity):
@@ -53,36 +52,24 @@ class AudiConnectLock(CoordinatorEntity, LockEntity):
         self._connection = connection
         self._vehicle = vehicle
         self._attr_unique_id = f"{vehicle.vin}_lock"
+        self._attr_device_info = coordinator.vehicle_meta(vehicle.vin).device_info
         self._attr_name = f"{vehicle.title} Lock"
         self._attr_icon = "mdi:car-door-lock"
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._vehicle.vin)},
-            "name": self._vehicle.title,
-            "manufacturer": "Audi",
-            "model": self._vehicle.model,
-            "sw_version": self._vehicle.model_year,
-        }
-
-    @property
+    @watched
     def is_locked(self) -> bool | None:
         """Return true if the lock is locked."""
-        if not self._vehicle or not self._vehicle.state:
+        if (view := self.coordinator.views.get(self._vehicle.vin)) is None:
             return None
-        
-        lock_status = self._vehicle.state.get("overallLockStatus")
-        return lock_status == "locked" if lock_status else None
+        return view.locked
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return (
             super().available
-            and self._vehicle is not None
-            and self._vehicle.state is not None
+            and self.coordinator.views.get(self._vehicle.vin) is not None
+            and self.coordinator.vehicle_available(self._vehicle.vin)
         )
 
     async def async_lock(self, **kwargs: Any) -> None:
@@ -103,32 +90,11 @@ class AudiConnectLock(CoordinatorEntity, LockEntity):
             _LOGGER.error("Failed to unlock vehicle %s: %s", self._vehicle.vin, ex)
             raise HomeAssistantError(f"Failed to unlock vehicle: {ex}") from ex
 
-    @property
+    @watched
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional state attributes."""
-        if not self._vehicle or not self._vehicle.state:
+        if (view := self.coordinator.views.get(self._vehicle.vin)) is None:
             return None
-            
-        attributes = {}
-        vehicle_state = self._vehicle.state
-        
-        # Add detailed door status
-        for door in ["leftFront", "rightFront", "leftRear", "rightRear"]:
-            door_status = vehicle_state.get(f"{door}DoorLocked")
-            if door_status is not None:
-                attributes[f"{door.lower()}_door_locked"] = door_status
-        
-        # Add trunk status
-        trunk_status = vehicle_state.get("trunkLocked")
-        if trunk_status is not None:
-            attributes["trunk_locked"] = trunk_status
-        
-        # Add last update time
-        if hasattr(self._vehicle, 'last_update_time'):
-            attributes["last_update"] = self._vehicle.last_update_time
-            
-        # Add VIN (last 4 digits only for privacy)
-        if self._vehicle.vin:
-            attributes["vin"] = f"***{self._vehicle.vin[-4:]}"
-            
-        return attributes if attributes else None
\ No newline at end of file
+        return self.coordinator.stale_attributes(
+            self._vehicle.vin, view.attributes["lock"] or None
+        )
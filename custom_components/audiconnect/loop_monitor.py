@@ -0,0 +1,176 @@
+"""Event loop monitoring for the Audi Connect integration."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable, Coroutine, Generator, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+import sys
+import threading
+import time
+import traceback
+import types
+from types import TracebackType
+from typing import Any, TypeVar
+
+from homeassistant.util import dt as dt_util
+
+_T = TypeVar("_T")
+
+
+class LoopBlockProbe:
+    """Measure how long the event loop is held while a block of code runs.
+
+    A probe task wakes up every ``interval`` seconds; any delay past the
+    expected wake-up time is time during which the loop could not run it.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        """Initialize the probe."""
+        self.interval = interval
+        self.blocked = 0.0
+        self.max_block = 0.0
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> LoopBlockProbe:
+        """Start probing."""
+        self._task = asyncio.get_running_loop().create_task(self._async_probe())
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop probing."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _async_probe(self) -> None:
+        """Accumulate the lag of each wake-up."""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            if (lag := loop.time() - expected) > 0:
+                self.blocked += lag
+                self.max_block = max(self.max_block, lag)
+
+
+@dataclass
+class StallRecord:
+    """A segment that held the event loop longer than the threshold."""
+
+    segment: str
+    duration: float
+    when: str
+    stacks: list[list[str]] = field(default_factory=list)
+
+
+class StallWatchdog:
+    """Record integration code paths that hold the event loop too long.
+
+    Segments are timed on the event loop thread. A sampler thread captures
+    the stack of the event loop thread while a segment runs past the
+    threshold, so the records show where the time was spent.
+    """
+
+    def __init__(
+        self, threshold: float = 0.1, max_records: int = 50, max_samples: int = 5
+    ) -> None:
+        """Initialize the watchdog."""
+        self.threshold = threshold
+        self.max_samples = max_samples
+        self.records: deque[StallRecord] = deque(maxlen=max_records)
+        self._loop_thread = threading.get_ident()
+        self._active: tuple[str, float] | None = None
+        self._samples: list[list[str]] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._sample, name="audiconnect_watchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampler thread."""
+        self._stop.set()
+
+    @contextmanager
+    def segment(self, name: str) -> Iterator[None]:
+        """Time a synchronous segment running on the event loop."""
+        parent = self._active
+        start = time.perf_counter()
+        self._active = (name, start)
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self._active = parent
+            with self._lock:
+                stacks, self._samples = self._samples, []
+            if duration > self.threshold:
+                self.records.append(
+                    StallRecord(
+                        name, round(duration, 4), dt_util.utcnow().isoformat(), stacks
+                    )
+                )
+
+    async def async_run(self, name: str, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Await a coroutine, timing each step it runs on the event loop."""
+        return await self._step(name, coro)
+
+    @types.coroutine
+    def _step(
+        self, name: str, coro: Coroutine[Any, Any, _T]
+    ) -> Generator[Any, Any, _T]:
+        """Drive a coroutine one step at a time."""
+        value: Any = None
+        error: BaseException | None = None
+        while True:
+            with self.segment(name):
+                try:
+                    future = coro.throw(error) if error else coro.send(value)
+                except StopIteration as stop:
+                    return stop.value
+            try:
+                value, error = (yield future), None
+            except BaseException as err:  # pylint: disable=broad-except
+                value, error = None, err
+
+    def _sample(self) -> None:
+        """Capture the event loop stack of segments over the threshold."""
+        interval = self.threshold / 2
+        while not self._stop.wait(interval):
+            if (active := self._active) is None:
+                continue
+            if time.perf_counter() - active[1] < self.threshold:
+                continue
+            frames = sys._current_frames()  # pylint: disable=protected-access
+            if (frame := frames.get(self._loop_thread)) is None:
+                continue
+            stack = [
+                f"{summary.filename}:{summary.lineno} {summary.name}"
+                for summary in traceback.extract_stack(frame)[-15:]
+            ]
+            with self._lock:
+                if len(self._samples) < self.max_samples:
+                    self._samples.append(stack)
+
+
+def watched(func: Callable[[Any], _T]) -> property:
+    """Property timed by the coordinator stall watchdog when it is enabled."""
+
+    @wraps(func)
+    def wrapper(self: Any) -> _T:
+        if (watchdog := self.coordinator.watchdog) is None:
+            return func(self)
+        with watchdog.segment(f"{self.entity_id}.{func.__name__}"):
+            return func(self)
+
+    return property(wrapper)
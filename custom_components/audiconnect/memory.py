@@ -0,0 +1,216 @@
+"""On-demand memory profiling of the integration."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+import logging
+from pathlib import Path
+import sys
+import tracemalloc
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DATA_MEMORY_PROFILER, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+CLIENT_PACKAGE = "audiconnectpy"
+DEFAULT_FRAMES = 5
+DEFAULT_TOP = 20
+# Attempts to size a vehicle changed by the event loop meanwhile.
+SIZE_ATTEMPTS = 3
+OWN_MODULES = (CLIENT_PACKAGE, __package__ or DOMAIN)
+
+
+def deep_size(value: Any, seen: set[int] | None = None) -> int:
+    """Return the size of an object and of what it references.
+
+    Containers are always followed, other objects only when they come from
+    the integration or the client library, so shared Home Assistant and
+    aiohttp objects are counted shallow.
+    """
+    seen = set() if seen is None else seen
+    stack = [value]
+    size = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, type):
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item, 0)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, list | tuple | set | frozenset | deque):
+            stack.extend(item)
+        elif item is value or type(item).__module__.startswith(OWN_MODULES):
+            if hasattr(item, "__dict__"):
+                stack.append(vars(item))
+            for slot in getattr(type(item), "__slots__", ()):
+                if hasattr(item, slot):
+                    stack.append(getattr(item, slot))
+    return size
+
+
+def _copy(value: Any) -> Any:
+    """Return a shallow copy of a container, other values as they are."""
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list | set | deque):
+        return list(value)
+    return value
+
+
+def vehicle_snapshots(coordinator: Any) -> dict[str, dict[str, Any]]:
+    """Return copies of the containers held for each vehicle, by pseudonym.
+
+    Taken on the event loop, so push and refresh updates do not change
+    them while they are sized in the executor.
+    """
+    snapshots = {}
+    for vin, vehicle in (coordinator.data or {}).items():
+        # Objects shared with the client, like the session, count once.
+        shared = (coordinator.api, getattr(vehicle, "_client", None))
+        snapshots[coordinator.recorder.redaction.alias(vin)] = {
+            "vehicle": {
+                key: _copy(value)
+                for key, value in vars(vehicle).items()
+                if not any(value is item for item in shared)
+            },
+            "view": coordinator.views.get(vin),
+            "cache": coordinator.cache.values(vin),
+            "charging": _copy(coordinator.charging.vehicles.get(vin)),
+        }
+    return snapshots
+
+
+def _size(value: Any) -> int:
+    """Return the deep size of a value, again if it changed meanwhile."""
+    for attempt in range(SIZE_ATTEMPTS):
+        try:
+            return deep_size(value)
+        except RuntimeError:
+            if attempt == SIZE_ATTEMPTS - 1:
+                raise
+    return 0
+
+
+def vehicle_sizes(snapshots: dict[str, dict[str, Any]]) -> dict[str, dict[str, int]]:
+    """Return the memory held for each vehicle of the snapshots."""
+    return {
+        alias: {name: _size(value) for name, value in parts.items()}
+        for alias, parts in snapshots.items()
+    }
+
+
+def _package_dirs() -> list[str]:
+    """Return the directories of the integration and the client library."""
+    dirs = [str(Path(__file__).parent)]
+    if (client := sys.modules.get(CLIENT_PACKAGE)) and client.__file__:
+        dirs.append(str(Path(client.__file__).parent))
+    return dirs
+
+
+def _site(statistic: Any) -> str:
+    """Return the allocation site of a statistic."""
+    frame = statistic.traceback[0]
+    return f"{frame.filename}:{frame.lineno}"
+
+
+class MemoryProfiler:
+    """Sample the allocations made by the integration and its client."""
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        self._baseline: tracemalloc.Snapshot | None = None
+        self._started_tracing = False
+
+    @property
+    def active(self) -> bool:
+        """Return True while profiling."""
+        return self._baseline is not None
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        """Take a snapshot limited to the integration allocations."""
+        return tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(True, f"{path}/*") for path in _package_dirs()]
+        )
+
+    def start(self, frames: int = DEFAULT_FRAMES) -> None:
+        """Start tracing, unless already traced by someone else."""
+        if self.active:
+            raise HomeAssistantError("Memory profiling is already running")
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start(frames)
+        self._baseline = self._snapshot()
+
+    def stop(self, top: int = DEFAULT_TOP) -> dict[str, Any]:
+        """Stop tracing and return the top allocation sites and growth."""
+        if self._baseline is None:
+            raise HomeAssistantError("Memory profiling is not running")
+        snapshot = self._snapshot()
+        baseline, self._baseline = self._baseline, None
+        if self._started_tracing:
+            tracemalloc.stop()
+        statistics = snapshot.statistics("lineno")
+        return {
+            "traced_kib": round(sum(stat.size for stat in statistics) / 1024, 1),
+            "top": [
+                {
+                    "site": _site(stat),
+                    "size_kib": round(stat.size / 1024, 1),
+                    "count": stat.count,
+                }
+                for stat in statistics[:top]
+            ],
+            "growth": [
+                {
+                    "site": _site(stat),
+                    "size_diff_kib": round(stat.size_diff / 1024, 1),
+                    "count_diff": stat.count_diff,
+                }
+                for stat in snapshot.compare_to(baseline, "lineno")[:top]
+                if stat.size_diff
+            ],
+        }
+
+
+def profiler(hass: HomeAssistant) -> MemoryProfiler:
+    """Return the profiler shared by the entries."""
+    if (memory := hass.data.get(DATA_MEMORY_PROFILER)) is None:
+        memory = hass.data[DATA_MEMORY_PROFILER] = MemoryProfiler()
+    return memory
+
+
+async def async_start_profiling(hass: HomeAssistant, frames: int) -> None:
+    """Start the memory profiling."""
+    await hass.async_add_executor_job(profiler(hass).start, frames)
+    _LOGGER.info("Memory profiling of %s started", DOMAIN)
+
+
+def _report(
+    memory: MemoryProfiler, snapshots: dict[str, dict[str, dict[str, Any]]], top: int
+) -> dict[str, Any]:
+    """Stop the profiler and add the memory held for each vehicle by entry."""
+    report = memory.stop(top)
+    report["vehicles"] = {
+        entry_id: vehicle_sizes(vehicles) for entry_id, vehicles in snapshots.items()
+    }
+    return report
+
+
+async def async_stop_profiling(
+    hass: HomeAssistant, coordinators: Iterable[Any], top: int
+) -> dict[str, Any]:
+    """Stop the memory profiling and return the report."""
+    # Pseudonyms are given per entry.
+    snapshots = {
+        coordinator.entry.entry_id: vehicle_snapshots(coordinator)
+        for coordinator in coordinators
+    }
+    report = await hass.async_add_executor_job(_report, profiler(hass), snapshots, top)
+    _LOGGER.info("Memory profiling of %s stopped", DOMAIN)
+    return report
@@ -0,0 +1,174 @@
+"""Instrumentation of the Audi Connect API calls."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import (
+    ClientSession,
+    TraceConfig,
+    TraceRequestEndParams,
+    TraceRequestExceptionParams,
+    TraceRequestStartParams,
+    TraceResponseChunkReceivedParams,
+    hdrs,
+)
+from yarl import URL
+
+ENDPOINT_LOGIN = "login"
+ENDPOINT_VEHICLES = "vehicles"
+ENDPOINT_STATUS = "status"
+ENDPOINT_POSITION = "position"
+ENDPOINT_TRIPS = "trips"
+ENDPOINT_OTHER = "other"
+ENDPOINT_GROUPS = (
+    ENDPOINT_LOGIN,
+    ENDPOINT_VEHICLES,
+    ENDPOINT_STATUS,
+    ENDPOINT_POSITION,
+    ENDPOINT_TRIPS,
+    ENDPOINT_OTHER,
+)
+
+# Upper bounds (seconds) of the latency histogram buckets.
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_LOGIN_MARKERS = ("identity", "/login", "/oidc", "/token", "/authorize", "/signin")
+
+
+def endpoint_group(url: URL) -> str:
+    """Return the endpoint group of a request url."""
+    path = url.path.lower()
+    if any(marker in f"{url.host}{path}" for marker in _LOGIN_MARKERS):
+        return ENDPOINT_LOGIN
+    if "trip" in path:
+        return ENDPOINT_TRIPS
+    if "position" in path:
+        return ENDPOINT_POSITION
+    if "status" in path:
+        return ENDPOINT_STATUS
+    if "graphql" in path or path.rstrip("/").endswith("/vehicles"):
+        return ENDPOINT_VEHICLES
+    return ENDPOINT_OTHER
+
+
+@dataclass
+class EndpointMetrics:
+    """Counters of an endpoint group."""
+
+    requests: int = 0
+    errors: dict[str, int] = field(default_factory=dict)
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    latency_sum: float = 0.0
+    latency_max: float = 0.0
+    payload_bytes: int = 0
+    wire_bytes: int = 0
+    compressed: int = 0
+
+    @property
+    def latency_avg(self) -> float | None:
+        """Return the average latency in seconds."""
+        return self.latency_sum / self.requests if self.requests else None
+
+    @property
+    def error_count(self) -> int:
+        """Return the number of failed requests."""
+        return sum(self.errors.values())
+
+    def record(self, latency: float, error: str | None = None) -> None:
+        """Record a finished request."""
+        self.requests += 1
+        self.latency_sum += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        if error:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters as a dictionary."""
+        labels = [f"le_{bound}" for bound in LATENCY_BUCKETS] + ["le_inf"]
+        return {
+            "requests": self.requests,
+            "errors": dict(self.errors),
+            "latency_avg": self.latency_avg,
+            "latency_max": self.latency_max,
+            "histogram": dict(zip(labels, self.buckets)),
+            "payload_bytes": self.payload_bytes,
+            "wire_bytes": self.wire_bytes,
+            "compressed": self.compressed,
+        }
+
+
+class ApiMetrics:
+    """Registry of the API calls made for a config entry."""
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self.endpoints = {group: EndpointMetrics() for group in ENDPOINT_GROUPS}
+
+    def trace_config(self) -> TraceConfig:
+        """Return an aiohttp trace config feeding the registry."""
+        trace_config = TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_request_end.append(self._on_request_end)
+        trace_config.on_request_exception.append(self._on_request_exception)
+        trace_config.on_response_chunk_received.append(self._on_chunk_received)
+        return trace_config
+
+    async def _on_request_start(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestStartParams,
+    ) -> None:
+        context.group = endpoint_group(params.url)
+        context.start = time.monotonic()
+        context.wire_length = None
+
+    async def _on_request_end(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestEndParams,
+    ) -> None:
+        response = params.response
+        metrics = self.endpoints[context.group]
+        metrics.record(
+            time.monotonic() - context.start,
+            f"http_{response.status}" if response.status >= 400 else None,
+        )
+        # Chunks are counted once decompressed, the wire size comes from
+        # the headers when the server sends it.
+        if (length := response.content_length) is not None:
+            context.wire_length = length
+            metrics.wire_bytes += length
+        if response.headers.get(hdrs.CONTENT_ENCODING, "identity") != "identity":
+            metrics.compressed += 1
+
+    async def _on_request_exception(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestExceptionParams,
+    ) -> None:
+        self.endpoints[context.group].record(
+            time.monotonic() - context.start, type(params.exception).__name__
+        )
+
+    async def _on_chunk_received(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceResponseChunkReceivedParams,
+    ) -> None:
+        metrics = self.endpoints[context.group]
+        metrics.payload_bytes += len(params.chunk)
+        if context.wire_length is None:
+            metrics.wire_bytes += len(params.chunk)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the registry as a dictionary."""
+        return {group: metrics.as_dict() for group, metrics in self.endpoints.items()}
@@ -3,8 +3,6 @@ from __future__ import annotations
 
 import logging
 
-from audiconnectpy import AudiException
-
 from homeassistant.components.number import NumberDeviceClass as dc, NumberEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -13,6 +11,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .const import DOMAIN
 from .entity import AudiEntity
 from .helpers import AudiNumberDescription
+from .loop_monitor import watched
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,14 +48,15 @@ async def async_setup_entry(
     """Set up the switch."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    for vin, vehicle in coordinator.data.items():
-        for name in vehicle.states:
+    def vehicle_entities(vin: str) -> list[AudiNumber]:
+        entities = []
+        for name in coordinator.data[vin].states:
             for description in SENSOR_TYPES:
                 if description.key == name:
                     entities.append(AudiNumber(coordinator, vin, description))
+        return entities
 
-    async_add_entities(entities)
+    coordinator.async_add_vehicle_entities(async_add_entities, vehicle_entities)
 
 
 class AudiNumber(AudiEntity, NumberEntity):
@@ -67,7 +67,7 @@ class AudiNumber(AudiEntity, NumberEntity):
         """Mode."""
         return "box"
 
-    @property
+    @watched
     def native_value(self) -> float:
         """Native value."""
         value = self.coordinator.data[self.vin].states.get(self.uid)
@@ -77,6 +77,8 @@ class AudiNumber(AudiEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the text value."""
+        from audiconnectpy import AudiException
+
         try:
             await getattr(
                 self.coordinator.api.vehicles.get(self.vin),
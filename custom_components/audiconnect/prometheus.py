@@ -0,0 +1,219 @@
+"""Coordinator metrics served in the Prometheus text exposition format."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_METRICS_ENDPOINT, DATA_METRICS_VIEW, DOMAIN
+from .metrics import LATENCY_BUCKETS, EndpointMetrics
+from .wakeup import PRIORITY_SHARE
+
+if TYPE_CHECKING:
+    from .coordinator import AudiDataUpdateCoordinator
+
+METRICS_URL = f"/api/{DOMAIN}/metrics"
+CONTENT_TYPE_PROMETHEUS = "text/plain; version=0.0.4; charset=utf-8"
+PREFIX = DOMAIN
+
+
+def _escape(value: Any) -> str:
+    """Escape a label value."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float | bool) -> str:
+    """Format a sample value."""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# Metric families: name without the prefix, type and help text.
+FAMILIES = {
+    "refreshes_total": ("counter", "Coordinator refreshes."),
+    "refresh_errors_total": ("counter", "Failed coordinator refreshes."),
+    "refresh_duration_seconds": ("histogram", "Duration of the refreshes."),
+    "last_refresh_success": ("gauge", "Whether the last refresh succeeded."),
+    "poll_interval_seconds": ("gauge", "Delay to the next scheduled refresh."),
+    "stale_data_seconds": ("gauge", "Age of the data kept after failed refreshes."),
+    "refresh_failures": ("gauge", "Sub-fetches that failed in the last refresh."),
+    "api_requests_total": ("counter", "Audi Connect API requests."),
+    "api_errors_total": ("counter", "Failed Audi Connect API requests."),
+    "api_latency_seconds": ("histogram", "Latency of the API requests."),
+    "api_payload_bytes_total": ("counter", "Decoded response bytes."),
+    "api_wire_bytes_total": ("counter", "Response bytes on the wire."),
+    "cache_hits_total": ("counter", "Responses served from the cache."),
+    "cache_misses_total": ("counter", "Responses fetched on a cache miss."),
+    "cache_evictions_total": ("counter", "Responses evicted from the cache."),
+    "cache_entries": ("gauge", "Responses held by the cache."),
+    "push_connected": ("gauge", "Whether the push channel is connected."),
+    "push_updates_total": ("counter", "Partial states received by push."),
+    "stalls": ("gauge", "Event loop stalls held by the watchdog."),
+    "vehicle_data_age_seconds": ("gauge", "Age of the state of the vehicle."),
+    "wakeup_budget": ("gauge", "Vehicle wake-ups left by priority and window."),
+    "wakeups_joined_total": ("counter", "Wake-ups joining a running one."),
+    "wakeups_rejected_total": ("counter", "Wake-ups rejected by the budget."),
+}
+
+
+class MetricsWriter:
+    """Collect samples grouped by metric family."""
+
+    def __init__(self) -> None:
+        """Initialize the writer."""
+        self._samples: dict[str, list[str]] = {}
+
+    def add(
+        self, name: str, value: float | bool | None, suffix: str = "", **labels: Any
+    ) -> None:
+        """Add a sample, skipped when the value is unknown."""
+        if value is None:
+            return
+        label = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+        self._samples.setdefault(name, []).append(
+            f"{PREFIX}_{name}{suffix}{{{label}}} {_number(value)}"
+            if label
+            else f"{PREFIX}_{name}{suffix} {_number(value)}"
+        )
+
+    def histogram(self, name: str, metrics: EndpointMetrics, **labels: Any) -> None:
+        """Add the latency histogram of an endpoint group."""
+        count = 0
+        for bound, bucket in zip((*LATENCY_BUCKETS, "+Inf"), metrics.buckets):
+            count += bucket
+            self.add(name, count, "_bucket", **labels, le=bound)
+        self.add(name, metrics.latency_sum, "_sum", **labels)
+        self.add(name, metrics.requests, "_count", **labels)
+
+    def render(self) -> str:
+        """Return the exposition text."""
+        lines = []
+        for name, samples in self._samples.items():
+            kind, description = FAMILIES[name]
+            lines.append(f"# HELP {PREFIX}_{name} {description}")
+            lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+def _data_age(vehicle: Any, now: datetime) -> float | None:
+    """Return the age of the state reported by a vehicle in seconds."""
+    value = getattr(vehicle, "states", {}).get("last_update_time")
+    if isinstance(value, str):
+        value = dt_util.parse_datetime(value)
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=dt_util.UTC)
+    return round((now - value).total_seconds(), 3)
+
+
+def write_coordinator(
+    writer: MetricsWriter, coordinator: AudiDataUpdateCoordinator
+) -> None:
+    """Add the metrics of a config entry."""
+    entry = coordinator.entry.entry_id
+    refreshes = coordinator.refreshes
+    writer.add("refreshes_total", refreshes.requests, entry=entry)
+    for error, count in refreshes.errors.items():
+        writer.add("refresh_errors_total", count, entry=entry, error=error)
+    writer.histogram("refresh_duration_seconds", refreshes, entry=entry)
+    writer.add("last_refresh_success", coordinator.last_update_success, entry=entry)
+    if interval := coordinator.update_interval:
+        writer.add("poll_interval_seconds", interval.total_seconds(), entry=entry)
+    writer.add("stale_data_seconds", coordinator.data_age() or 0, entry=entry)
+
+    for group, metrics in coordinator.metrics.endpoints.items():
+        labels = {"entry": entry, "endpoint": group}
+        writer.add("api_requests_total", metrics.requests, **labels)
+        for error, count in metrics.errors.items():
+            writer.add("api_errors_total", count, **labels, error=error)
+        writer.histogram("api_latency_seconds", metrics, **labels)
+        writer.add("api_payload_bytes_total", metrics.payload_bytes, **labels)
+        writer.add("api_wire_bytes_total", metrics.wire_bytes, **labels)
+
+    cache = coordinator.cache.as_dict()
+    for key in ("hits", "misses", "evictions"):
+        writer.add(f"cache_{key}_total", cache[key], entry=entry)
+    writer.add("cache_entries", cache["entries"], entry=entry)
+
+    push = coordinator.push
+    writer.add("push_connected", bool(push and push.connected), entry=entry)
+    writer.add("push_updates_total", coordinator.push_updates, entry=entry)
+    if coordinator.watchdog:
+        writer.add("stalls", len(coordinator.watchdog.records), entry=entry)
+
+    now = dt_util.utcnow()
+    for vin, vehicle in (coordinator.data or {}).items():
+        # Same pseudonym as in the traffic recordings of the entry.
+        alias = coordinator.recorder.redaction.alias(vin)
+        age = _data_age(vehicle, now)
+        writer.add("vehicle_data_age_seconds", age, entry=entry, vin=alias)
+        for fetch in ("update", "fences"):
+            key = vin if fetch == "update" else f"{vin}.{fetch}"
+            failed = key in coordinator.failures
+            writer.add("refresh_failures", failed, entry=entry, vin=alias, fetch=fetch)
+        for priority in PRIORITY_SHARE:
+            remaining = coordinator.wakeups.remaining(vin, priority)
+            for window, value in remaining.items():
+                writer.add(
+                    "wakeup_budget",
+                    value,
+                    entry=entry,
+                    vin=alias,
+                    priority=priority,
+                    window=window,
+                )
+    writer.add("wakeups_joined_total", coordinator.wakeups.piggybacked, entry=entry)
+    writer.add("wakeups_rejected_total", coordinator.wakeups.rejected, entry=entry)
+
+
+def render_metrics(coordinators: Iterable[AudiDataUpdateCoordinator]) -> str:
+    """Return the metrics of the coordinators."""
+    writer = MetricsWriter()
+    for coordinator in coordinators:
+        write_coordinator(writer, coordinator)
+    return writer.render()
+
+
+class AudiMetricsView(HomeAssistantView):
+    """Serve the metrics of the entries with the endpoint enabled."""
+
+    url = METRICS_URL
+    name = f"api:{DOMAIN}:metrics"
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the metrics."""
+        coordinators = [
+            coordinator
+            for coordinator in self.hass.data.get(DOMAIN, {}).values()
+            if coordinator.options.get(CONF_METRICS_ENDPOINT)
+        ]
+        if not coordinators:
+            return self.json_message("Metrics endpoint disabled", HTTPStatus.NOT_FOUND)
+        return web.Response(
+            body=render_metrics(coordinators).encode(),
+            headers={hdrs.CONTENT_TYPE: CONTENT_TYPE_PROMETHEUS},
+        )
+
+
+@callback
+def async_register_metrics_view(hass: HomeAssistant) -> None:
+    """Register the metrics view once; views cannot be unregistered."""
+    if hass.data.get(DATA_METRICS_VIEW):
+        return
+    hass.http.register_view(AudiMetricsView(hass))
+    hass.data[DATA_METRICS_VIEW] = True
@@ -0,0 +1,162 @@
+"""Push ingestion of partial vehicle states."""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import logging
+from typing import Any
+
+from aiohttp import ClientError, ClientSession, WSMsgType
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.util.json import json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
+RECONNECT_MIN = 1
+RECONNECT_MAX = 300
+
+
+@dataclass(frozen=True)
+class PushUpdate:
+    """Partial state of a vehicle (doors, lock, charge, position...)."""
+
+    vin: str
+    states: dict[str, Any] = field(default_factory=dict)
+    state: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PushUpdate:
+        """Build an update from a decoded message."""
+        vin, states, state = data["vin"], data.get("states", {}), data.get("state", {})
+        if not isinstance(vin, str) or not isinstance(states, dict):
+            raise ValueError("Push message without a VIN or states")
+        if not isinstance(state, dict):
+            raise ValueError("Push message with an invalid state")
+        return cls(vin, states, state)
+
+
+class PushChannel(ABC):
+    """Channel delivering partial vehicle states to the coordinator."""
+
+    connected = False
+
+    @abstractmethod
+    async def async_start(
+        self,
+        on_update: Callable[[PushUpdate], None],
+        on_connection: Callable[[bool], None],
+    ) -> None:
+        """Start delivering updates and connection changes."""
+
+    @abstractmethod
+    async def async_stop(self) -> None:
+        """Stop the channel."""
+
+
+class LocalPushChannel(PushChannel):
+    """In-process publisher, a stand-in for a real push service in tests."""
+
+    def __init__(self) -> None:
+        """Initialize the channel."""
+        self._on_update: Callable[[PushUpdate], None] | None = None
+
+    async def async_start(
+        self,
+        on_update: Callable[[PushUpdate], None],
+        on_connection: Callable[[bool], None],
+    ) -> None:
+        """Start delivering updates."""
+        self._on_update = on_update
+        self.connected = True
+        on_connection(True)
+
+    async def async_stop(self) -> None:
+        """Stop delivering updates."""
+        self._on_update = None
+        self.connected = False
+
+    def publish(
+        self,
+        vin: str,
+        states: dict[str, Any] | None = None,
+        state: dict[str, Any] | None = None,
+    ) -> None:
+        """Publish a partial state."""
+        if self._on_update:
+            self._on_update(PushUpdate(vin, states or {}, state or {}))
+
+
+class WebSocketPushChannel(PushChannel):
+    """Receive JSON updates ``{"vin": ..., "states": {...}}`` from a websocket."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        session: ClientSession,
+        url: str,
+    ) -> None:
+        """Initialize the channel."""
+        self._hass = hass
+        self._entry = entry
+        self._session = session
+        self.url = url
+        self._task: asyncio.Task | None = None
+
+    async def async_start(
+        self,
+        on_update: Callable[[PushUpdate], None],
+        on_connection: Callable[[bool], None],
+    ) -> None:
+        """Connect and keep the connection alive in the background."""
+        self._task = self._entry.async_create_background_task(
+            self._hass,
+            self._async_run(on_update, on_connection),
+            f"audiconnect push {self._entry.entry_id}",
+        )
+
+    async def async_stop(self) -> None:
+        """Disconnect."""
+        # Cleared first so the stopped task does not report the loss.
+        self.connected = False
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _async_run(
+        self,
+        on_update: Callable[[PushUpdate], None],
+        on_connection: Callable[[bool], None],
+    ) -> None:
+        """Read messages, reconnecting with backoff."""
+        delay = RECONNECT_MIN
+        while True:
+            try:
+                async with self._session.ws_connect(self.url, heartbeat=30) as ws:
+                    self.connected = True
+                    on_connection(True)
+                    delay = RECONNECT_MIN
+                    async for message in ws:
+                        if message.type is not WSMsgType.TEXT:
+                            continue
+                        try:
+                            update = PushUpdate.from_dict(json_loads(message.data))
+                        except (ValueError, KeyError, TypeError) as error:
+                            _LOGGER.debug("Invalid push message: %s", error)
+                            continue
+                        try:
+                            on_update(update)
+                        except Exception:  # pylint: disable=broad-except
+                            _LOGGER.exception("Error handling a push update")
+            except (ClientError, TimeoutError) as error:
+                _LOGGER.debug("Push channel error: %s", error)
+            finally:
+                if self.connected:
+                    self.connected = False
+                    on_connection(False)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX)
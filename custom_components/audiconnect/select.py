@@ -3,8 +3,6 @@ from __future__ import annotations
 
 import logging
 
-from audiconnectpy import AudiException
-
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -13,6 +11,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .const import DOMAIN
 from .entity import AudiEntity
 from .helpers import AudiSelectDescription
+from .loop_monitor import watched
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,20 +32,21 @@ async def async_setup_entry(
     """Set up the switch."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    for vin, vehicle in coordinator.data.items():
-        for name in vehicle.states:
+    def vehicle_entities(vin: str) -> list[AudiSelect]:
+        entities = []
+        for name in coordinator.data[vin].states:
             for description in SENSOR_TYPES:
                 if description.key == name:
                     entities.append(AudiSelect(coordinator, vin, description))
+        return entities
 
-    async_add_entities(entities)
+    coordinator.async_add_vehicle_entities(async_add_entities, vehicle_entities)
 
 
 class AudiSelect(AudiEntity, SelectEntity):
     """Representation of a Audi select."""
 
-    @property
+    @watched
     def current_option(self):
         """Return sensor state."""
         value = self.coordinator.data[self.vin].states.get(self.uid)
@@ -56,6 +56,8 @@ class AudiSelect(AudiEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
+        from audiconnectpy import AudiException
+
         try:
             await getattr(
                 self.coordinator.api.vehicles.get(self.vin),
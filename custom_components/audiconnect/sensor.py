@@ -1,16 +1,37 @@
 """Support for Audi Connect sensors."""
 from __future__ import annotations
 
+from datetime import datetime
 import logging
 
-from homeassistant.components.sensor import SensorDeviceClass as dc, SensorEntity
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass as dc,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfEnergy,
+    UnitOfTime,
+)
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
-from .entity import AudiEntity
+from .const import DOMAIN, MANUFACTURER
+from .coordinator import AudiDataUpdateCoordinator
+from .entity import AudiEntity, AudiVehicleEntity
 from .helpers import AudiSensorDescription
+from .loop_monitor import watched
+from .metrics import ENDPOINT_GROUPS
+from .wakeup import PRIORITY_NORMAL, PRIORITY_SHARE
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -258,9 +279,9 @@ async def async_setup_entry(
     """Set up sensor."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    for vin, vehicle in coordinator.data.items():
-        for name in vehicle.states:
+    def vehicle_entities(vin: str) -> list[SensorEntity]:
+        entities = []
+        for name in coordinator.data[vin].states:
             for description in SENSOR_TYPES:
                 if description.key == name:
                     if description.key in [
@@ -272,14 +293,25 @@ async def async_setup_entry(
                         entities.append(AudiTripSensor(coordinator, vin, description))
                     else:
                         entities.append(AudiSensor(coordinator, vin, description))
+        if "charging_power" in coordinator.data[vin].states:
+            entities.extend(
+                AudiChargingEnergySensor(coordinator, vin, kind)
+                for kind in ("session", "total")
+            )
+        entities.append(AudiWakeUpBudgetSensor(coordinator, vin))
+        return entities
 
-    async_add_entities(entities)
+    coordinator.async_add_vehicle_entities(async_add_entities, vehicle_entities)
+    async_add_entities(
+        AudiMetricSensor(coordinator, entry, group) for group in ENDPOINT_GROUPS
+    )
+    async_add_entities([AudiCacheSensor(coordinator, entry)])
 
 
 class AudiSensor(AudiEntity, SensorEntity):
     """Representation of a Audi sensor."""
 
-    @property
+    @watched
     def state(self):
         """Return sensor state."""
         value = self.coordinator.data[self.vin].states.get(self.uid)
@@ -291,7 +323,7 @@ class AudiSensor(AudiEntity, SensorEntity):
 class AudiTripSensor(AudiEntity, SensorEntity):
     """Representation of a Audi sensor."""
 
-    @property
+    @watched
     def state(self):
         """Return sensor state."""
         value = self.coordinator.data[self.vin].states.get(self.uid)
@@ -299,7 +331,180 @@ class AudiTripSensor(AudiEntity, SensorEntity):
             return self.entity_description.value_fn(value)
         return value
 
-    @property
+    @watched
     def extra_state_attributes(self):
         """Return extra state attributes."""
-        return self.coordinator.data[self.vin].states.get(self.uid)
+        return self.coordinator.stale_attributes(
+            self.vin, self.coordinator.data[self.vin].states.get(self.uid)
+        )
+
+
+class AudiChargingEnergySensor(AudiVehicleEntity, SensorEntity):
+    """Energy of the charging sessions integrated by the coordinator."""
+
+    _attr_device_class = dc.ENERGY
+    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _attr_icon = "mdi:battery-charging-high"
+
+    def __init__(
+        self, coordinator: AudiDataUpdateCoordinator, vin: str, kind: str
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, vin)
+        self.kind = kind
+        self._attr_unique_id = f"{vin}_charging_energy_{kind}"
+        self._attr_name = (
+            "Charging session energy" if kind == "session" else "Charged energy"
+        )
+        self._attr_state_class = (
+            SensorStateClass.TOTAL
+            if kind == "session"
+            else SensorStateClass.TOTAL_INCREASING
+        )
+
+    @watched
+    def native_value(self) -> float | None:
+        """Return the energy."""
+        if self.kind == "session":
+            return self.coordinator.charging.session_energy(self.vin)
+        return self.coordinator.charging.total_energy(self.vin)
+
+    @watched
+    def last_reset(self) -> datetime | None:
+        """Return the start of the session."""
+        if self.kind == "session":
+            return self.coordinator.charging.session_start(self.vin)
+        return None
+
+
+class AudiWakeUpBudgetSensor(AudiVehicleEntity, SensorEntity):
+    """Wake-ups of the vehicle still allowed to normal priority requests."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:car-clock"
+    _attr_name = "Wake-up budget"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator: AudiDataUpdateCoordinator, vin: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, vin)
+        self._attr_unique_id = f"{vin}_wakeup_budget"
+
+    @watched
+    def native_value(self) -> int:
+        """Return the wake-ups available now."""
+        return min(
+            self.coordinator.wakeups.remaining(self.vin, PRIORITY_NORMAL).values()
+        )
+
+    @watched
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the budget left to each priority."""
+        wakeups = self.coordinator.wakeups
+        last_wake = wakeups.last_wake(self.vin)
+        return self.coordinator.stale_attributes(
+            self.vin,
+            {
+                **{
+                    f"{priority}_{window}": remaining
+                    for priority in PRIORITY_SHARE
+                    for window, remaining in wakeups.remaining(
+                        self.vin, priority
+                    ).items()
+                },
+                "last_wake": (
+                    dt_util.utc_from_timestamp(last_wake) if last_wake else None
+                ),
+                "in_flight": wakeups.in_flight(self.vin),
+            },
+        )
+
+
+class AudiMetricSensor(CoordinatorEntity[AudiDataUpdateCoordinator], SensorEntity):
+    """Latency of an API endpoint group, disabled by default."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self, coordinator: AudiDataUpdateCoordinator, entry: ConfigEntry, group: str
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.group = group
+        self.entity_description = SensorEntityDescription(
+            key=f"api_{group}_latency",
+            icon="mdi:timer-outline",
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            device_class=dc.DURATION,
+            state_class=SensorStateClass.MEASUREMENT,
+        )
+        self._attr_unique_id = f"{entry.entry_id}_api_{group}_latency"
+        self._attr_name = f"API {group} latency"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "manufacturer": MANUFACTURER,
+            "name": entry.title,
+            "entry_type": DeviceEntryType.SERVICE,
+        }
+
+    @watched
+    def native_value(self) -> float | None:
+        """Return the average latency."""
+        if (
+            latency := self.coordinator.metrics.endpoints[self.group].latency_avg
+        ) is None:
+            return None
+        return round(latency * 1000, 1)
+
+    @watched
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return request, error and payload counters."""
+        metrics = self.coordinator.metrics.endpoints[self.group]
+        return {
+            "requests": metrics.requests,
+            "error_count": metrics.error_count,
+            "errors": dict(metrics.errors),
+            "latency_max": round(metrics.latency_max * 1000, 1),
+            "payload_bytes": metrics.payload_bytes,
+            "wire_bytes": metrics.wire_bytes,
+            "histogram": metrics.as_dict()["histogram"],
+        }
+
+
+class AudiCacheSensor(CoordinatorEntity[AudiDataUpdateCoordinator], SensorEntity):
+    """Hit ratio of the response cache, disabled by default."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_icon = "mdi:cached"
+    _attr_name = "API cache hit ratio"
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self, coordinator: AudiDataUpdateCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{entry.entry_id}_api_cache_hit_ratio"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "manufacturer": MANUFACTURER,
+            "name": entry.title,
+            "entry_type": DeviceEntryType.SERVICE,
+        }
+
+    @watched
+    def native_value(self) -> float | None:
+        """Return the hit ratio."""
+        if (ratio := self.coordinator.cache.hit_ratio) is None:
+            return None
+        return round(ratio * 100, 1)
+
+    @watched
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the cache counters."""
+        return self.coordinator.cache.as_dict()
@@ -20,6 +20,7 @@ from .const import (
     ACTION_START_WINDOW_HEATING,
     ACTION_STOP_WINDOW_HEATING,
 )
+from .loop_monitor import watched
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,24 +30,21 @@ SWITCH_TYPES = {
         "icon": "mdi:air-conditioner",
         "start_action": ACTION_START_CLIMATISATION,
         "stop_action": ACTION_STOP_CLIMATISATION,
-        "state_key": "climatisationState",
-        "on_state": "on",
+        "view_attribute": "climatisation",
     },
     "charger": {
         "name": "Charger",
         "icon": "mdi:ev-station",
         "start_action": ACTION_START_CHARGER,
         "stop_action": ACTION_STOP_CHARGER,
-        "state_key": "chargingState",
-        "on_state": "charging",
+        "view_attribute": "charging",
     },
     "window_heating": {
         "name": "Window Heating",
         "icon": "mdi:car-defrost-rear",
         "start_action": ACTION_START_WINDOW_HEATING,
         "stop_action": ACTION_STOP_WINDOW_HEATING,
-        "state_key": "windowHeatingState",
-        "on_state": "on",
+        "view_attribute": "window_heating",
     },
 }
 
@@ -57,23 +55,21 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the switch platform."""
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
-    connection = hass.data[DOMAIN][config_entry.entry_id]["connection"]
-
-    entities = []
-    
-    for vehicle in coordinator.data or []:
-        for switch_type in SWITCH_TYPES:
-            entities.append(
-                AudiConnectSwitch(
-                    coordinator,
-                    connection,
-                    vehicle,
-                    switch_type,
-                )
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    connection = coordinator.api
+
+    def vehicle_entities(vin: str) -> list[AudiConnectSwitch]:
+        return [
+            AudiConnectSwitch(
+                coordinator,
+                connection,
+                coordinator.data[vin],
+                switch_type,
             )
+            for switch_type in SWITCH_TYPES
+        ]
 
-    async_add_entities(entities)
+    coordinator.async_add_vehicle_entities(async_add_entities, vehicle_entities)
 
 
 class AudiConnectSwitch(CoordinatorEntity, SwitchEntity):
@@ -92,45 +88,29 @@ class AudiConnectSwitch(CoordinatorEntity, SwitchEntity):
         self._vehicle = vehicle
         self._switch_type = switch_type
         self._attr_unique_id = f"{vehicle.vin}_{switch_type}"
+        self._attr_device_info = coordinator.vehicle_meta(vehicle.vin).device_info
         
         switch_config = SWITCH_TYPES[switch_type]
         self._attr_name = f"{vehicle.title} {switch_config['name']}"
         self._attr_icon = switch_config.get("icon")
         self._start_action = switch_config["start_action"]
         self._stop_action = switch_config["stop_action"]
-        self._state_key = switch_config["state_key"]
-        self._on_state = switch_config["on_state"]
+        self._view_attribute = switch_config["view_attribute"]
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._vehicle.vin)},
-            "name": self._vehicle.title,
-            "manufacturer": "Audi",
-            "model": self._vehicle.model,
-            "sw_version": self._vehicle.model_year,
-        }
-
-    @property
+    @watched
     def is_on(self) -> bool | None:
         """Return true if the switch is on."""
-        if not self._vehicle or not self._vehicle.state:
-            return None
-        
-        state_value = self._vehicle.state.get(self._state_key)
-        if state_value is None:
+        if (view := self.coordinator.views.get(self._vehicle.vin)) is None:
             return None
-            
-        return str(state_value).lower() == self._on_state
+        return getattr(view, self._view_attribute)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return (
             super().available
-            and self._vehicle is not None
-            and self._vehicle.state is not None
+            and self.coordinator.views.get(self._vehicle.vin) is not None
+            and self.coordinator.vehicle_available(self._vehicle.vin)
         )
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -169,36 +149,11 @@ class AudiConnectSwitch(CoordinatorEntity, SwitchEntity):
                 f"Failed to turn off {self._switch_type}: {ex}"
             ) from ex
 
-    @property
+    @watched
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional state attributes."""
-        if not self._vehicle or not self._vehicle.state:
+        if (view := self.coordinator.views.get(self._vehicle.vin)) is None:
             return None
-            
-        attributes = {}
-        vehicle_state = self._vehicle.state
-        
-        # Add switch-specific attributes
-        if self._switch_type == "climatisation":
-            temp = vehicle_state.get("targetTemperature")
-            if temp:
-                attributes["target_temperature"] = temp
-                
-        elif self._switch_type == "charger":
-            remaining_time = vehicle_state.get("chargingRemainingTime")
-            if remaining_time:
-                attributes["charging_remaining_time"] = remaining_time
-            
-            charging_rate = vehicle_state.get("chargingRate")
-            if charging_rate:
-                attributes["charging_rate"] = charging_rate
-        
-        # Add last update time
-        if hasattr(self._vehicle, 'last_update_time'):
-            attributes["last_update"] = self._vehicle.last_update_time
-            
-        # Add VIN (last 4 digits only for privacy)
-        if self._vehicle.vin:
-            attributes["vin"] = f"***{self._vehicle.vin[-4:]}"
-            
-        return attributes if attributes else None
\ No newline at end of file
+        return self.coordinator.stale_attributes(
+            self._vehicle.vin, view.attributes[self._switch_type] or None
+        )
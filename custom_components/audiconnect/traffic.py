@@ -0,0 +1,298 @@
+"""Recording of the Audi Connect API traffic for offline replay.
+
+The request and response pairs of the API session are captured by an
+aiohttp trace config and appended to a gzip compressed JSON lines file
+after each refresh. Keys listed in the diagnostics redaction rules are
+redacted, VINs are replaced by stable pseudonyms and tokens by unsigned
+tokens keeping only their validity, so a recording can be shared and
+replayed without the account.
+"""
+from __future__ import annotations
+
+import base64
+from collections.abc import Iterable
+import gzip
+import json
+import logging
+from pathlib import Path
+import re
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+from urllib.parse import quote
+
+from aiohttp import (
+    ClientSession,
+    TraceConfig,
+    TraceRequestEndParams,
+    TraceRequestRedirectParams,
+    TraceRequestStartParams,
+    TraceResponseChunkReceivedParams,
+    hdrs,
+)
+from yarl import URL
+
+from .const import REDACT_KEYS
+
+_LOGGER = logging.getLogger(__name__)
+
+RECORDING_VERSION = 1
+# Recording stops once the file reaches this size.
+MAX_RECORDING_BYTES = 50 * 1024 * 1024
+REDACTED = "**REDACTED**"
+VIN_KEYS = frozenset({"vin", "mappingvin"})
+TOKEN_KEYS = frozenset(
+    {
+        "access_token",
+        "authorization",
+        "hmac",
+        "id_token",
+        "refresh_token",
+        "token",
+        "_csrf",
+    }
+)
+# Query parameters of the login redirects carrying one-time values.
+QUERY_KEYS = TOKEN_KEYS | REDACT_KEYS | {"code", "nonce", "state"}
+JWT = re.compile(r"eyJ[\w-]+\.[\w-]+\.[\w-]*")
+JWT_CLAIMS = ("exp", "iat", "nbf")
+
+
+def pseudonym(index: int) -> str:
+    """Return the pseudonym VIN of the n-th vehicle seen."""
+    return f"WAUZZZ{index:011d}"
+
+
+def _b64(data: dict[str, Any]) -> str:
+    """Encode a token part."""
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+
+def fake_jwt(token: str) -> str:
+    """Return an unsigned token keeping only the validity claims."""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+    except (IndexError, ValueError):
+        claims = None
+    if not isinstance(claims, dict):
+        claims = {}
+    kept = {key: claims[key] for key in JWT_CLAIMS if key in claims}
+    return f"{_b64({'alg': 'none', 'typ': 'JWT'})}.{_b64(kept)}.redacted"
+
+
+class Redaction:
+    """Consistent redaction of the recorded traffic.
+
+    Pseudonyms are assigned on the event loop and while writing in the
+    executor, so the VINs are guarded by a lock.
+    """
+
+    def __init__(self, secrets: Iterable[str | None] = ()) -> None:
+        """Initialize the redaction with the account secrets."""
+        self.vins: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._secrets = sorted(
+            {
+                variant
+                for secret in secrets
+                if secret
+                for variant in (secret, quote(secret))
+            },
+            key=len,
+            reverse=True,
+        )
+
+    def alias(self, vin: str) -> str:
+        """Return the pseudonym of a VIN, assigning it when new."""
+        with self._lock:
+            if (alias := self.vins.get(vin)) is None:
+                alias = self.vins[vin] = pseudonym(len(self.vins))
+        return alias
+
+    def learn(self, value: Any) -> None:
+        """Assign pseudonyms to the VINs found in a payload."""
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if str(key).lower() in VIN_KEYS and isinstance(item, str) and item:
+                    self.alias(item)
+                else:
+                    self.learn(item)
+        elif isinstance(value, list):
+            for item in value:
+                self.learn(item)
+
+    def text(self, value: str) -> str:
+        """Redact a string."""
+        for secret in self._secrets:
+            value = value.replace(secret, REDACTED)
+        with self._lock:
+            vins = list(self.vins.items())
+        for vin, alias in vins:
+            value = value.replace(vin, alias)
+        return JWT.sub(lambda match: fake_jwt(match.group()), value)
+
+    def data(self, value: Any) -> Any:
+        """Return a redacted copy of a JSON payload."""
+        if isinstance(value, dict):
+            result = {}
+            for key, item in value.items():
+                lower = str(key).lower()
+                if lower in VIN_KEYS and isinstance(item, str):
+                    result[key] = self.vins.get(item, item)
+                elif lower in TOKEN_KEYS and isinstance(item, str):
+                    result[key] = fake_jwt(item) if JWT.fullmatch(item) else REDACTED
+                elif lower in REDACT_KEYS:
+                    result[key] = REDACTED
+                else:
+                    result[key] = self.data(item)
+            return result
+        if isinstance(value, list):
+            return [self.data(item) for item in value]
+        if isinstance(value, str):
+            return self.text(value)
+        return value
+
+    def url(self, url: URL) -> str:
+        """Redact the query values and path of a url."""
+        query = {
+            key: REDACTED if key.lower() in QUERY_KEYS else value
+            for key, value in url.query.items()
+        }
+        return self.text(str(url.with_query(query)))
+
+
+class TrafficRecorder:
+    """Record the API traffic of a session while active."""
+
+    def __init__(self, path: Path, secrets: Iterable[str | None] = ()) -> None:
+        """Initialize the recorder."""
+        self.path = path
+        self.active = False
+        self.recorded = 0
+        self.redaction = Redaction(secrets)
+        self._pending: list[dict[str, Any]] = []
+        self._started = time.monotonic()
+        self._full = False
+
+    def trace_config(self) -> TraceConfig:
+        """Return an aiohttp trace config feeding the recorder."""
+        trace_config = TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_request_redirect.append(self._on_request_redirect)
+        trace_config.on_request_end.append(self._on_request_end)
+        trace_config.on_response_chunk_received.append(self._on_chunk_received)
+        return trace_config
+
+    async def _on_request_start(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestStartParams,
+    ) -> None:
+        context.record = None
+        context.last = time.monotonic()
+
+    def _record(
+        self, context: SimpleNamespace, method: str, url: URL, response: Any
+    ) -> dict[str, Any]:
+        """Add an exchange to the pending records."""
+        now = time.monotonic()
+        record = {
+            "t": round(context.last - self._started, 3),
+            "duration": round(now - context.last, 3),
+            "method": method,
+            "url": url,
+            "status": response.status,
+            "content_type": response.headers.get(hdrs.CONTENT_TYPE),
+            "body": [],
+        }
+        if location := response.headers.get(hdrs.LOCATION):
+            # Relative locations would resolve against the replay server.
+            record["location"] = response.url.join(URL(location))
+        context.last = now
+        self._pending.append(record)
+        return record
+
+    async def _on_request_redirect(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestRedirectParams,
+    ) -> None:
+        if self.active:
+            self._record(context, params.method, params.url, params.response)
+
+    async def _on_request_end(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestEndParams,
+    ) -> None:
+        if self.active:
+            context.record = self._record(
+                context, params.method, params.url, params.response
+            )
+
+    async def _on_chunk_received(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceResponseChunkReceivedParams,
+    ) -> None:
+        if getattr(context, "record", None) is not None:
+            context.record["body"].append(params.chunk)
+
+    def take(self) -> list[dict[str, Any]]:
+        """Return the exchanges recorded since the last call."""
+        pending, self._pending = self._pending, []
+        return pending
+
+    def _encode(self, record: dict[str, Any]) -> dict[str, Any]:
+        """Redact an exchange and decode its body."""
+        raw = b"".join(record.pop("body"))
+        body: Any = None
+        if raw:
+            try:
+                body = json.loads(raw)
+            except ValueError:
+                record["text"] = self.redaction.text(raw.decode(errors="replace"))
+            else:
+                self.redaction.learn(body)
+        if body is not None:
+            record["json"] = self.redaction.data(body)
+        record["url"] = self.redaction.url(record["url"])
+        if location := record.get("location"):
+            record["location"] = self.redaction.url(location)
+        return record
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        """Redact and append exchanges to the recording."""
+        if self._full or not records:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lines = []
+        if not self.path.exists():
+            lines.append({"version": RECORDING_VERSION})
+        lines.extend(self._encode(record) for record in records)
+        with gzip.open(self.path, "at", encoding="utf-8") as file:
+            for line in lines:
+                file.write(json.dumps(line, separators=(",", ":")) + "\n")
+        self.recorded += len(records)
+        if self.path.stat().st_size >= MAX_RECORDING_BYTES:
+            _LOGGER.warning(
+                "Traffic recording %s is full, recording stopped", self.path
+            )
+            self._full = True
+
+
+def read_recording(path: Path) -> list[dict[str, Any]]:
+    """Return the exchanges of a recording."""
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        lines = [json.loads(line) for line in file if line.strip()]
+    if not lines or lines[0].get("version") != RECORDING_VERSION:
+        raise ValueError(f"Unsupported recording: {path}")
+    return lines[1:]
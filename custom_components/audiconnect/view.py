@@ -0,0 +1,161 @@
+"""Derived state and metadata of a vehicle shared by its entities."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant.helpers.device_registry import DeviceInfo
+
+from .const import DOMAIN, MANUFACTURER, URL_WEBSITE
+
+DOORS = ("leftFront", "rightFront", "leftRear", "rightRear")
+
+
+@dataclass(frozen=True, slots=True)
+class VehicleMeta:
+    """Static metadata of a vehicle, created once and shared by its entities.
+
+    ``device_info`` is returned as is by every entity of the vehicle and
+    must not be modified.
+    """
+
+    device_info: DeviceInfo
+    attributes: Mapping[str, Any]
+
+    @classmethod
+    def from_vehicle(cls, vin: str, vehicle: Any) -> VehicleMeta:
+        """Build the metadata of a vehicle."""
+        return cls(
+            device_info=DeviceInfo(
+                identifiers={(DOMAIN, vin)},
+                manufacturer=MANUFACTURER,
+                name=vehicle.title,
+                model=vehicle.model,
+                configuration_url=URL_WEBSITE,
+            ),
+            attributes=MappingProxyType(
+                {
+                    "model": vehicle.model,
+                    "model_year": vehicle.model_year,
+                    "title": vehicle.title,
+                    "csid": vehicle.csid,
+                    "vin": vin,
+                }
+            ),
+        )
+
+
+def _float(value: Any) -> float | None:
+    """Return a coordinate as a float."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _on(value: Any, on_state: str) -> bool | None:
+    """Return whether a raw activity state matches ``on_state``."""
+    return None if value is None else str(value).lower() == on_state
+
+
+@dataclass(frozen=True, slots=True)
+class VehicleView:
+    """State of a vehicle derived once per refresh or push.
+
+    Entities read these attributes directly instead of walking the raw
+    state on each property access. The attribute dictionaries are built
+    once and must not be modified.
+    """
+
+    vin: str
+    masked_vin: str
+    lock_status: str | None = None
+    locked: bool | None = None
+    any_door_unlocked: bool = False
+    any_window_open: bool = False
+    trunk_unlocked: bool = False
+    hood_open: bool = False
+    is_moving: bool = False
+    latitude: float | None = None
+    longitude: float | None = None
+    climatisation: bool | None = None
+    charging: bool | None = None
+    window_heating: bool | None = None
+    binary_sensors: Mapping[str, bool | None] = field(default_factory=dict)
+    attributes: Mapping[str, dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def from_vehicle(cls, vehicle: Any) -> VehicleView | None:
+        """Derive the view of a vehicle, None without a state."""
+        if not (state := getattr(vehicle, "state", None)):
+            return None
+        base: dict[str, Any] = {}
+        if hasattr(vehicle, "last_update_time"):
+            base["last_update"] = vehicle.last_update_time
+        masked_vin = f"***{vehicle.vin[-4:]}" if vehicle.vin else ""
+        if masked_vin:
+            base["vin"] = masked_vin
+
+        lock_status = state.get("overallLockStatus")
+        any_door_unlocked = state.get("anyDoorUnlocked", False)
+        any_window_open = state.get("anyWindowOpen", False)
+        trunk_unlocked = state.get("trunkUnlocked", False)
+        hood_open = state.get("hoodOpen", False)
+        is_moving = state.get("isMoving", False)
+        position = state.get("position") or {}
+        parking = state.get("parkingPosition")
+
+        lock = {
+            f"{door.lower()}_door_locked": state[f"{door}DoorLocked"]
+            for door in DOORS
+            if state.get(f"{door}DoorLocked") is not None
+        }
+        if (trunk_locked := state.get("trunkLocked")) is not None:
+            lock["trunk_locked"] = trunk_locked
+        tracker = {"is_moving": is_moving}
+        if parking:
+            tracker = {"parking_time": parking.get("parkingTime"), **tracker}
+        climatisation = {}
+        if temperature := state.get("targetTemperature"):
+            climatisation["target_temperature"] = temperature
+        charger = {}
+        if remaining_time := state.get("chargingRemainingTime"):
+            charger["charging_remaining_time"] = remaining_time
+        if charging_rate := state.get("chargingRate"):
+            charger["charging_rate"] = charging_rate
+
+        return cls(
+            vin=vehicle.vin,
+            masked_vin=masked_vin,
+            lock_status=lock_status,
+            locked=lock_status == "locked" if lock_status else None,
+            any_door_unlocked=any_door_unlocked,
+            any_window_open=any_window_open,
+            trunk_unlocked=trunk_unlocked,
+            hood_open=hood_open,
+            is_moving=is_moving,
+            latitude=_float(position.get("lat")),
+            longitude=_float(position.get("lng")),
+            climatisation=_on(state.get("climatisationState"), "on"),
+            charging=_on(state.get("chargingState"), "charging"),
+            window_heating=_on(state.get("windowHeatingState"), "on"),
+            binary_sensors={
+                "doors_locked": lock_status == "locked",
+                "windows_closed": not any_window_open,
+                "any_door_unlocked": any_door_unlocked,
+                "any_window_open": any_window_open,
+                "trunk_unlocked": trunk_unlocked,
+                "hood_open": hood_open,
+                "is_moving": is_moving,
+            },
+            attributes={
+                "binary_sensor": base,
+                "lock": {**lock, **base},
+                "tracker": {**tracker, **base},
+                "climatisation": {**climatisation, **base},
+                "charger": {**charger, **base},
+                "window_heating": base,
+            },
+        )
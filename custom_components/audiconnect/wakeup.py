@@ -0,0 +1,130 @@
+"""Budget of the vehicle wake-ups requested by the refresh service."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine
+import logging
+import math
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+HOUR = 3600
+DAY = 24 * HOUR
+PRIORITY_LOW = "low"
+PRIORITY_NORMAL = "normal"
+PRIORITY_HIGH = "high"
+# Share of the budget a priority class may use; the rest is kept for the
+# higher classes.
+PRIORITY_SHARE = {PRIORITY_LOW: 0.5, PRIORITY_NORMAL: 0.8, PRIORITY_HIGH: 1.0}
+
+
+class WakeUpBudgetExceeded(HomeAssistantError):
+    """The wake-up budget of a vehicle is used up for a priority."""
+
+
+class WakeUpScheduler:
+    """Limit the wake-ups of each vehicle per hour and per day.
+
+    A wake-up requested while one is running for the same vehicle waits
+    for it instead of waking the vehicle again, and costs no budget.
+    Vehicles are named in logs and errors by ``label``, never by VIN.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        hourly: int,
+        daily: int,
+        label: Callable[[str], str],
+        now: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.entry = entry
+        self.hourly = hourly
+        self.daily = daily
+        self.piggybacked = 0
+        self.rejected = 0
+        self._label = label
+        self._now = now
+        self._wakes: dict[str, list[float]] = {}
+        self._in_flight: dict[str, asyncio.Task[Any]] = {}
+        self._store: Store[dict[str, list[float]]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.wakeups"
+        )
+
+    async def async_load(self) -> None:
+        """Load the wake-ups of the last day."""
+        if data := await self._store.async_load():
+            self._wakes = data
+            for vin in list(self._wakes):
+                self._prune(vin)
+
+    def _prune(self, vin: str) -> list[float]:
+        """Drop the wake-ups older than a day and return the others."""
+        since = self._now() - DAY
+        wakes = self._wakes[vin] = [
+            wake for wake in self._wakes.get(vin, []) if wake > since
+        ]
+        return wakes
+
+    def _used(self, vin: str) -> tuple[int, int]:
+        """Return the wake-ups of the last hour and of the last day."""
+        wakes = self._prune(vin)
+        since = self._now() - HOUR
+        return sum(wake > since for wake in wakes), len(wakes)
+
+    def remaining(self, vin: str, priority: str = PRIORITY_HIGH) -> dict[str, int]:
+        """Return the wake-ups left to a priority in the hour and the day."""
+        share = PRIORITY_SHARE[priority]
+        hour, day = self._used(vin)
+        return {
+            "hour": max(math.floor(self.hourly * share) - hour, 0),
+            "day": max(math.floor(self.daily * share) - day, 0),
+        }
+
+    def in_flight(self, vin: str) -> bool:
+        """Return True while a wake-up of the vehicle runs."""
+        return vin in self._in_flight
+
+    def last_wake(self, vin: str) -> float | None:
+        """Return the time of the last wake-up of the vehicle."""
+        wakes = self._wakes.get(vin)
+        return wakes[-1] if wakes else None
+
+    async def async_wake(
+        self,
+        vin: str,
+        wake: Callable[[], Coroutine[Any, Any, Any]],
+        priority: str = PRIORITY_NORMAL,
+    ) -> None:
+        """Wake a vehicle within its budget, or join the running wake-up."""
+        if (task := self._in_flight.get(vin)) is not None:
+            self.piggybacked += 1
+            _LOGGER.debug("Joining the running wake-up of %s", self._label(vin))
+            await asyncio.shield(task)
+            return
+        if not all(self.remaining(vin, priority).values()):
+            self.rejected += 1
+            raise WakeUpBudgetExceeded(
+                f"Wake-up budget of {self._label(vin)} used up for {priority} priority"
+            )
+        self._wakes.setdefault(vin, []).append(self._now())
+        self._store.async_delay_save(lambda: self._wakes, SAVE_DELAY)
+        task = self._in_flight[vin] = self.entry.async_create_background_task(
+            self.hass, wake(), f"{DOMAIN} wake-up"
+        )
+        task.add_done_callback(lambda _: self._in_flight.pop(vin, None))
+        await asyncio.shield(task)
@@ -0,0 +1,253 @@
+"""Zone and geofence evaluation of the vehicle positions."""
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+import logging
+import math
+from typing import Any
+
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import TrackStates, async_track_state_change_filtered
+from homeassistant.util.location import distance
+
+from .const import EVENT_ZONE
+
+_LOGGER = logging.getLogger(__name__)
+
+ZONE_DOMAIN = "zone"
+ATTR_RADIUS = "radius"
+ATTR_PASSIVE = "passive"
+SOURCE_HOME_ASSISTANT = "home_assistant"
+SOURCE_AUDI = "audi"
+# Attributes of a zone state defining its area. The state itself, the
+# number of persons in the zone, does not change the index.
+ZONE_GEOMETRY = (ATTR_LATITUDE, ATTR_LONGITUDE, ATTR_RADIUS, ATTR_PASSIVE)
+
+# Side of the grid cells in degrees (about 5.5 km of latitude).
+CELL_SIZE = 0.05
+METERS_PER_DEGREE = 111_320
+
+
+@dataclass(frozen=True, slots=True)
+class Zone:
+    """Circular zone."""
+
+    zone_id: str
+    name: str
+    latitude: float
+    longitude: float
+    radius: float
+    source: str
+
+    def cells(self) -> Iterator[tuple[int, int]]:
+        """Return the grid cells overlapped by the bounding box."""
+        lat_delta = self.radius / METERS_PER_DEGREE
+        lon_delta = self.radius / (
+            METERS_PER_DEGREE * max(math.cos(math.radians(self.latitude)), 0.01)
+        )
+        for row in range(
+            _cell(self.latitude - lat_delta), _cell(self.latitude + lat_delta) + 1
+        ):
+            for col in range(
+                _cell(self.longitude - lon_delta),
+                _cell(self.longitude + lon_delta) + 1,
+            ):
+                yield row, col
+
+    def contains(self, latitude: float, longitude: float) -> bool:
+        """Return True when a position lies in the zone."""
+        return (
+            distance(latitude, longitude, self.latitude, self.longitude) or 0
+        ) <= self.radius
+
+
+def _cell(degrees: float) -> int:
+    """Return the grid row or column of a coordinate."""
+    return math.floor(degrees / CELL_SIZE)
+
+
+class ZoneIndex:
+    """Grid index of zone bounding boxes."""
+
+    def __init__(self, zones: Iterable[Zone] = ()) -> None:
+        """Index the zones."""
+        self.zones: dict[str, Zone] = {}
+        self._grid: defaultdict[tuple[int, int], list[Zone]] = defaultdict(list)
+        for zone in zones:
+            self.zones[zone.zone_id] = zone
+            for cell in zone.cells():
+                self._grid[cell].append(zone)
+
+    def lookup(self, latitude: float, longitude: float) -> set[str]:
+        """Return the zones containing a position."""
+        return {
+            zone.zone_id
+            for zone in self._grid.get((_cell(latitude), _cell(longitude)), ())
+            if zone.contains(latitude, longitude)
+        }
+
+
+def home_assistant_zones(hass: HomeAssistant) -> list[Zone]:
+    """Return the active Home Assistant zones."""
+    zones = []
+    for state in hass.states.async_all(ZONE_DOMAIN):
+        attributes = state.attributes
+        if attributes.get(ATTR_PASSIVE) or ATTR_LATITUDE not in attributes:
+            continue
+        zones.append(
+            Zone(
+                state.entity_id,
+                state.name,
+                attributes[ATTR_LATITUDE],
+                attributes[ATTR_LONGITUDE],
+                attributes.get(ATTR_RADIUS, 0),
+                SOURCE_HOME_ASSISTANT,
+            )
+        )
+    return zones
+
+
+def _degrees(value: Any) -> float:
+    """Return a coordinate sent in degrees or micro degrees."""
+    value = float(value)
+    return value / 1_000_000 if abs(value) > 180 else value
+
+
+def audi_fences(device_id: str, payload: Any) -> list[Zone]:
+    """Return the circular geofences found in a fences response."""
+    zones = []
+
+    def walk(value: Any) -> None:
+        if isinstance(value, list):
+            for item in value:
+                walk(item)
+            return
+        if not isinstance(value, dict):
+            return
+        circle = value.get("circle") or value.get("shape", {}).get("circle")
+        if isinstance(circle, dict) and isinstance(circle.get("center"), dict):
+            center = circle["center"]
+            name = value.get("definitionName") or value.get("name") or "fence"
+            try:
+                zones.append(
+                    Zone(
+                        f"{SOURCE_AUDI}.{device_id}.{len(zones)}",
+                        name,
+                        _degrees(center["latitude"]),
+                        _degrees(center["longitude"]),
+                        float(circle["radius"]),
+                        SOURCE_AUDI,
+                    )
+                )
+            except (KeyError, TypeError, ValueError):
+                _LOGGER.debug("Unsupported fence definition: %s", name)
+            return
+        for item in value.values():
+            walk(item)
+
+    walk(payload)
+    return zones
+
+
+class ZoneTracker:
+    """Fire enter and leave events when a vehicle crosses a zone border.
+
+    Home Assistant zones share one grid index, rebuilt when a zone changes;
+    the Audi fences of each vehicle have their own. A position is only
+    looked up when it differs from the previous one of the vehicle.
+    Events name the vehicle by the device id returned by `device_id`.
+    """
+
+    def __init__(self, hass: HomeAssistant, device_id: Callable[[str], str]) -> None:
+        """Initialize the tracker."""
+        self.hass = hass
+        self._device_id = device_id
+        self.lookups = 0
+        self._zones: ZoneIndex | None = None
+        self._fences: dict[str, ZoneIndex] = {}
+        self._positions: dict[str, tuple[float, float]] = {}
+        self._inside: dict[str, set[str]] = {}
+        self._unsub: Callable[[], None] | None = async_track_state_change_filtered(
+            hass, TrackStates(False, set(), {ZONE_DOMAIN}), self._async_zone_changed
+        ).async_remove
+
+    @callback
+    def _async_zone_changed(self, event: Event) -> None:
+        """Rebuild the index on the next lookup when a zone area changed."""
+        old, new = event.data.get("old_state"), event.data.get("new_state")
+        if (
+            old is not None
+            and new is not None
+            and all(
+                old.attributes.get(key) == new.attributes.get(key)
+                for key in ZONE_GEOMETRY
+            )
+        ):
+            return
+        self._zones = None
+        self._positions.clear()
+
+    def set_fences(self, vin: str, fences: list[Zone]) -> None:
+        """Replace the Audi fences of a vehicle."""
+        index = ZoneIndex(fences)
+        if index.zones.keys() != getattr(self._fences.get(vin), "zones", {}).keys():
+            self._positions.pop(vin, None)
+        self._fences[vin] = index
+
+    def zones_of(self, vin: str) -> set[str]:
+        """Return the zones a vehicle is in."""
+        return self._inside.get(vin, set())
+
+    @callback
+    def async_evaluate(
+        self, vin: str, latitude: float | None, longitude: float | None
+    ) -> None:
+        """Look up a new position and fire the zone transitions."""
+        if latitude is None or longitude is None:
+            return
+        if self._positions.get(vin) == (latitude, longitude):
+            return
+        self._positions[vin] = (latitude, longitude)
+        if self._zones is None:
+            self._zones = ZoneIndex(home_assistant_zones(self.hass))
+        self.lookups += 1
+        inside = self._zones.lookup(latitude, longitude)
+        if fences := self._fences.get(vin):
+            inside |= fences.lookup(latitude, longitude)
+        previous = self._inside.get(vin)
+        self._inside[vin] = inside
+        if previous is None:
+            return
+        for transition, zone_ids in (
+            ("leave", previous - inside),
+            ("enter", inside - previous),
+        ):
+            for zone_id in zone_ids:
+                zone = self._zones.zones.get(zone_id) or (
+                    fences.zones.get(zone_id) if fences else None
+                )
+                self.hass.bus.async_fire(
+                    EVENT_ZONE,
+                    {
+                        "device_id": self._device_id(vin),
+                        "zone": zone_id,
+                        "name": zone.name if zone else zone_id,
+                        "source": zone.source if zone else None,
+                        "transition": transition,
+                    },
+                )
+
+    def forget(self, vin: str) -> None:
+        """Drop the state of a vehicle."""
+        self._fences.pop(vin, None)
+        self._positions.pop(vin, None)
+        self._inside.pop(vin, None)
+
+    def stop(self) -> None:
+        """Stop listening to zone changes."""
+        if self._unsub:
+            self._unsub()
+            self._unsub = None